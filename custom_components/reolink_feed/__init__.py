@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from collections.abc import Callable
+from itertools import islice
 import json
 import logging
 from pathlib import Path
+import time
 from urllib.parse import parse_qs, urlsplit
 
 import voluptuous as vol
@@ -23,7 +26,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ENTITY_ID, CONF_ID, EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.json import json_bytes
 
 from .const import (
     CARD_FILENAME,
@@ -46,13 +49,16 @@ from .const import (
     MIN_MAX_STORAGE_GB,
     MIN_RETENTION_HOURS,
     SUPPORTED_DETECTION_LABELS,
+    SUPPORTED_DETECTION_LABELS_SET,
+    clamp_number,
     normalize_detection_label,
 )
-from .feed import ReolinkFeedManager
+from .feed import ReolinkFeedManager, async_await_shared_task
 
 _LOGGER = logging.getLogger(__name__)
 _LOCAL_CARD_URL_PATH = "/local/reolink-feed-card.js"
-_INTEGRATION_VERSION_CACHE_KEY = f"{DOMAIN}_integration_version"
+_REGISTRATIONS_KEY = f"{DOMAIN}_registrations"
+_MOCK_LABEL_CHOICES: tuple[str, ...] = (*SUPPORTED_DETECTION_LABELS, *LEGACY_LABEL_ALIASES)
 
 
 @dataclass(slots=True)
@@ -61,11 +67,31 @@ class ReolinkFeedData:
 
     manager: ReolinkFeedManager
     options_unsub: Callable[[], None] | None = None
+    list_payload_version: int = -1
+    list_payload_cache: dict[tuple[frozenset[str], int], bytes] = field(default_factory=dict)
+    list_payload_tasks: dict[frozenset[str], asyncio.Task[bytes]] = field(default_factory=dict)
 
 
 ReolinkFeedConfigEntry = ConfigEntry[ReolinkFeedData]
 
 
+@dataclass(slots=True)
+class _Registrations:
+    """Hass-wide registrations that outlive config entry reloads."""
+
+    card_static_path: bool = False
+    ws_commands: bool = False
+    services: bool = False
+
+
+@callback
+def _registrations(hass: HomeAssistant) -> _Registrations:
+    registrations = hass.data.get(_REGISTRATIONS_KEY)
+    if registrations is None:
+        registrations = hass.data[_REGISTRATIONS_KEY] = _Registrations()
+    return registrations
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up integration from YAML (none)."""
     return True
@@ -97,6 +123,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ReolinkFeedConfigEntry)
     await entry.runtime_data.manager.async_stop()
     if not hass.config_entries.async_entries(DOMAIN):
         hass.services.async_remove(DOMAIN, "mock_detection")
+        _registrations(hass).services = False
     return True
 
 
@@ -107,14 +134,15 @@ async def _async_reload_entry_on_update(hass: HomeAssistant, entry: ReolinkFeedC
 
 async def _async_register_card_resource(hass: HomeAssistant) -> None:
     """Expose the bundled Lovelace card JavaScript as a static URL."""
-    if hass.data.get(f"{DOMAIN}_card_registered"):
+    registrations = _registrations(hass)
+    if registrations.card_static_path:
         return
 
     card_file = Path(__file__).parent / "frontend" / CARD_FILENAME
     await hass.http.async_register_static_paths(
         [StaticPathConfig(CARD_URL_PATH, str(card_file), cache_headers=False)]
     )
-    hass.data[f"{DOMAIN}_card_registered"] = True
+    registrations.card_static_path = True
 
 
 async def _async_ensure_lovelace_card_resource(hass: HomeAssistant) -> None:
@@ -139,7 +167,7 @@ async def _async_try_add_lovelace_card_resource(hass: HomeAssistant) -> bool:
         return True
 
     await resources.async_get_info()
-    integration_version = await _async_integration_version(hass)
+    integration_version = _INTEGRATION_VERSION
     target_url = _card_resource_url(integration_version)
     existing_card_item: dict | None = None
     for item in resources.async_items() or []:
@@ -180,12 +208,8 @@ def _integration_version() -> str:
     return str(version) if version else "dev"
 
 
-async def _async_integration_version(hass: HomeAssistant) -> str:
-    if cached := hass.data.get(_INTEGRATION_VERSION_CACHE_KEY):
-        return str(cached)
-    version = await hass.async_add_executor_job(_integration_version)
-    hass.data[_INTEGRATION_VERSION_CACHE_KEY] = version
-    return version
+# Home Assistant imports custom integrations in the executor, so this read never blocks the loop.
+_INTEGRATION_VERSION = _integration_version()
 
 
 def _card_resource_url(version: str) -> str:
@@ -202,18 +226,20 @@ def _resource_version_from_url(url: str) -> str | None:
 
 @callback
 def _async_register_ws_commands(hass: HomeAssistant) -> None:
-    if hass.data.get(f"{DOMAIN}_ws_registered"):
+    registrations = _registrations(hass)
+    if registrations.ws_commands:
         return
     websocket_api.async_register_command(hass, ws_list_items)
     websocket_api.async_register_command(hass, ws_resolve_recording)
     websocket_api.async_register_command(hass, ws_rebuild_from_history)
     websocket_api.async_register_command(hass, ws_delete_item)
-    hass.data[f"{DOMAIN}_ws_registered"] = True
+    registrations.ws_commands = True
 
 
 @callback
 def _async_register_services(hass: HomeAssistant) -> None:
-    if hass.services.has_service(DOMAIN, "mock_detection"):
+    registrations = _registrations(hass)
+    if registrations.services:
         return
 
     async def _handle_mock_detection(call) -> None:
@@ -237,20 +263,25 @@ def _async_register_services(hass: HomeAssistant) -> None:
             {
                 vol.Required(CONF_ENTITY_ID): cv.entity_id,
                 vol.Required("camera_name"): cv.string,
-                vol.Optional("label", default="person"): vol.In(
-                    list(SUPPORTED_DETECTION_LABELS) + list(LEGACY_LABEL_ALIASES)
-                ),
+                vol.Optional("label", default="person"): vol.In(_MOCK_LABEL_CHOICES),
                 vol.Optional("duration_s", default=8): cv.positive_int,
                 vol.Optional("create_dummy_snapshot", default=True): cv.boolean,
             }
         ),
     )
+    registrations.services = True
+
+
+def _requested_labels(value: list[str]) -> frozenset[str]:
+    """Normalize requested labels, dropping unsupported ones."""
+    normalized = (normalize_detection_label(label) for label in value)
+    return frozenset(label for label in normalized if label in SUPPORTED_DETECTION_LABELS_SET)
 
 
 @websocket_api.websocket_command(
     {
         "type": "reolink_feed/list",
-        vol.Optional("labels"): [cv.string],
+        vol.Optional("labels"): vol.All([cv.string], _requested_labels),
     }
 )
 @websocket_api.async_response
@@ -264,37 +295,67 @@ async def ws_list_items(
         return
 
     entry: ReolinkFeedConfigEntry = entries[0]
-    await entry.runtime_data.manager.async_migrate_legacy_snapshot_urls()
-    await entry.runtime_data.manager.async_prune_expired_items()
-    items = entry.runtime_data.manager.get_items()
-
-    enabled_labels = entry.runtime_data.manager.get_enabled_labels()
-    requested = {
-        normalize_detection_label(label)
-        for label in (msg.get("labels") or [])
-        if normalize_detection_label(label) in SUPPORTED_DETECTION_LABELS
-    }
-    labels = requested or enabled_labels
-
-    now_ts = dt_util.utcnow().timestamp()
-    since_seconds = entry.runtime_data.manager.get_retention_hours() * 3600
-    filtered = []
-    for item in items:
-        if item.label not in labels:
-            continue
-        age_seconds = now_ts - item.start_dt.timestamp()
-        if age_seconds <= since_seconds:
-            filtered.append(item.as_dict())
-        if len(filtered) >= LIST_ITEMS_LIMIT:
-            break
+    runtime_data = entry.runtime_data
+    labels = msg.get("labels") or runtime_data.manager.get_enabled_labels()
+    if not runtime_data.manager.has_items_with_labels(labels):
+        connection.send_message(
+            websocket_api.messages.construct_result_message(
+                msg["id"], _encode_list_payload(runtime_data.manager, [])
+            )
+        )
+        return
+
+    # Concurrent dashboard refreshes share one in-flight payload build.
+    payload = await async_await_shared_task(
+        hass,
+        runtime_data.list_payload_tasks,
+        labels,
+        lambda: _async_build_list_payload(runtime_data, labels),
+    )
+
+    connection.send_message(
+        websocket_api.messages.construct_result_message(msg["id"], payload)
+    )
 
-    connection.send_result(
-        msg["id"],
+
+async def _async_build_list_payload(
+    runtime_data: ReolinkFeedData, labels: frozenset[str]
+) -> bytes:
+    """Return the JSON-encoded list result for the given labels."""
+    manager = runtime_data.manager
+    await manager.async_migrate_legacy_snapshot_urls()
+    await manager.async_prune_expired_items()
+
+    retention_hours = manager.get_retention_hours()
+
+    # Expired items are pruned above, so cached payloads only go stale on item changes.
+    items_version = manager.get_items_version()
+    if runtime_data.list_payload_version != items_version:
+        runtime_data.list_payload_cache.clear()
+        runtime_data.list_payload_version = items_version
+    cache_key = (labels, retention_hours)
+    payload = runtime_data.list_payload_cache.get(cache_key)
+    if payload is None:
+        now_ts = time.time()
+        since_seconds = retention_hours * 3600
+        matching = (
+            item
+            for item in manager.get_items_newer_than(now_ts - since_seconds)
+            if item.label in labels
+        )
+        filtered = [item.as_dict() for item in islice(matching, LIST_ITEMS_LIMIT)]
+        payload = _encode_list_payload(manager, filtered)
+        runtime_data.list_payload_cache[cache_key] = payload
+    return payload
+
+
+def _encode_list_payload(manager: ReolinkFeedManager, items: list[dict]) -> bytes:
+    return json_bytes(
         {
-            "items": filtered,
-            "enabled_labels": sorted(enabled_labels),
-            "retention_hours": entry.runtime_data.manager.get_retention_hours(),
-        },
+            "items": items,
+            "enabled_labels": sorted(manager.get_enabled_labels()),
+            "retention_hours": manager.get_retention_hours(),
+        }
     )
 
 
@@ -381,16 +442,17 @@ async def ws_delete_item(
     connection.send_result(msg["id"], {"ok": True})
 
 
-def _enabled_labels_from_entry(entry: ReolinkFeedConfigEntry) -> set[str]:
+def _enabled_labels_from_entry(entry: ReolinkFeedConfigEntry) -> frozenset[str]:
     raw = entry.options.get(CONF_ENABLED_LABELS)
-    selected: list[str]
-    if isinstance(raw, list):
-        selected = [normalize_detection_label(value) for value in raw]
-    else:
-        selected = list(DEFAULT_ENABLED_DETECTION_LABELS)
-    normalized = {value for value in selected if value in SUPPORTED_DETECTION_LABELS}
+    if not isinstance(raw, (list, tuple)):
+        return frozenset(DEFAULT_ENABLED_DETECTION_LABELS)
+    normalized = frozenset(
+        label
+        for label in map(normalize_detection_label, raw)
+        if label in SUPPORTED_DETECTION_LABELS_SET
+    )
     if not normalized:
-        return set(DEFAULT_ENABLED_DETECTION_LABELS)
+        return frozenset(DEFAULT_ENABLED_DETECTION_LABELS)
     return normalized
 
 
@@ -400,7 +462,7 @@ def _retention_hours_from_entry(entry: ReolinkFeedConfigEntry) -> int:
         value = int(raw)
     except (TypeError, ValueError):
         value = DEFAULT_RETENTION_HOURS
-    return max(MIN_RETENTION_HOURS, min(MAX_RETENTION_HOURS, value))
+    return clamp_number(value, MIN_RETENTION_HOURS, MAX_RETENTION_HOURS)
 
 
 def _max_detections_from_entry(entry: ReolinkFeedConfigEntry) -> int:
@@ -409,7 +471,7 @@ def _max_detections_from_entry(entry: ReolinkFeedConfigEntry) -> int:
         value = int(raw)
     except (TypeError, ValueError):
         value = DEFAULT_MAX_DETECTIONS
-    return max(MIN_MAX_DETECTIONS, min(MAX_MAX_DETECTIONS, value))
+    return clamp_number(value, MIN_MAX_DETECTIONS, MAX_MAX_DETECTIONS)
 
 
 def _max_storage_gb_from_entry(entry: ReolinkFeedConfigEntry) -> float:
@@ -418,4 +480,4 @@ def _max_storage_gb_from_entry(entry: ReolinkFeedConfigEntry) -> float:
         value = float(raw)
     except (TypeError, ValueError):
         value = DEFAULT_MAX_STORAGE_GB
-    return max(MIN_MAX_STORAGE_GB, min(MAX_MAX_STORAGE_GB, value))
+    return clamp_number(value, MIN_MAX_STORAGE_GB, MAX_MAX_STORAGE_GB)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any
+
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import SectionConfig, section
 from homeassistant.helpers import config_validation as cv
@@ -26,6 +31,8 @@ from .const import (
     MIN_MAX_STORAGE_GB,
     MIN_RETENTION_HOURS,
     SUPPORTED_DETECTION_LABELS,
+    SUPPORTED_DETECTION_LABELS_SET,
+    clamp_number,
 )
 
 
@@ -46,6 +53,31 @@ _LABEL_TITLES = {
     },
 }
 SECTION_RETENTION_POLICY = "retention_policy"
+_RETENTION_HOURS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=MIN_RETENTION_HOURS,
+        max=MAX_RETENTION_HOURS,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_MAX_DETECTIONS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=MIN_MAX_DETECTIONS,
+        max=MAX_MAX_DETECTIONS,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_MAX_STORAGE_GB_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=MIN_MAX_STORAGE_GB,
+        max=MAX_MAX_STORAGE_GB,
+        step=0.1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
 
 
 def _coerce_int(value: object, default: int, minimum: int, maximum: int) -> int:
@@ -53,7 +85,7 @@ def _coerce_int(value: object, default: int, minimum: int, maximum: int) -> int:
         coerced = int(value)
     except (TypeError, ValueError):
         coerced = default
-    return max(minimum, min(maximum, coerced))
+    return clamp_number(coerced, minimum, maximum)
 
 
 def _coerce_float(value: object, default: float, minimum: float, maximum: float) -> float:
@@ -61,7 +93,45 @@ def _coerce_float(value: object, default: float, minimum: float, maximum: float)
         coerced = float(value)
     except (TypeError, ValueError):
         coerced = default
-    return max(minimum, min(maximum, coerced))
+    return clamp_number(coerced, minimum, maximum)
+
+
+@dataclass(slots=True, frozen=True)
+class _NormalizedOptions:
+    labels: tuple[str, ...]
+    retention_hours: int
+    max_detections: int
+    max_storage_gb: float
+
+
+def _normalize_options(options: Mapping[str, Any]) -> _NormalizedOptions:
+    existing = options.get(CONF_ENABLED_LABELS)
+    labels: tuple[str, ...] = ()
+    if isinstance(existing, (list, tuple)):
+        labels = tuple(
+            dict.fromkeys(label for label in existing if label in SUPPORTED_DETECTION_LABELS_SET)
+        )
+    return _NormalizedOptions(
+        labels=labels or DEFAULT_ENABLED_DETECTION_LABELS,
+        retention_hours=_coerce_int(
+            options.get(CONF_RETENTION_HOURS, DEFAULT_RETENTION_HOURS),
+            DEFAULT_RETENTION_HOURS,
+            MIN_RETENTION_HOURS,
+            MAX_RETENTION_HOURS,
+        ),
+        max_detections=_coerce_int(
+            options.get(CONF_MAX_DETECTIONS, DEFAULT_MAX_DETECTIONS),
+            DEFAULT_MAX_DETECTIONS,
+            MIN_MAX_DETECTIONS,
+            MAX_MAX_DETECTIONS,
+        ),
+        max_storage_gb=_coerce_float(
+            options.get(CONF_MAX_STORAGE_GB, DEFAULT_MAX_STORAGE_GB),
+            DEFAULT_MAX_STORAGE_GB,
+            MIN_MAX_STORAGE_GB,
+            MAX_MAX_STORAGE_GB,
+        ),
+    )
 
 
 class ReolinkFeedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -87,6 +157,11 @@ class ReolinkFeedOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._config_entry = config_entry
 
+    @cached_property
+    def _options(self) -> _NormalizedOptions:
+        """Return the entry options, validated once per flow."""
+        return _normalize_options(self._config_entry.options)
+
     async def async_step_init(self, user_input=None):
         """Manage options."""
         if user_input is not None:
@@ -94,126 +169,77 @@ class ReolinkFeedOptionsFlow(config_entries.OptionsFlow):
             section_input = merged_input.pop(SECTION_RETENTION_POLICY, None)
             if isinstance(section_input, dict):
                 merged_input.update(section_input)
-            selected = [
-                label
-                for label in merged_input.get(CONF_ENABLED_LABELS, [])
-                if label in SUPPORTED_DETECTION_LABELS
-            ]
-            if not selected:
-                selected = list(DEFAULT_ENABLED_DETECTION_LABELS)
-            retention_hours = _coerce_int(
-                merged_input.get(CONF_RETENTION_HOURS, DEFAULT_RETENTION_HOURS),
-                DEFAULT_RETENTION_HOURS,
-                MIN_RETENTION_HOURS,
-                MAX_RETENTION_HOURS,
-            )
-            max_detections = _coerce_int(
-                merged_input.get(CONF_MAX_DETECTIONS, DEFAULT_MAX_DETECTIONS),
-                DEFAULT_MAX_DETECTIONS,
-                MIN_MAX_DETECTIONS,
-                MAX_MAX_DETECTIONS,
-            )
+            submitted = _normalize_options(merged_input)
             rebuild_now = bool(merged_input.get(CONF_REBUILD_NOW, False))
-            max_storage_gb = _coerce_float(
-                merged_input.get(CONF_MAX_STORAGE_GB, DEFAULT_MAX_STORAGE_GB),
-                DEFAULT_MAX_STORAGE_GB,
-                MIN_MAX_STORAGE_GB,
-                MAX_MAX_STORAGE_GB,
-            )
             if rebuild_now:
-                entry = next(
-                    (
-                        candidate
-                        for candidate in self.hass.config_entries.async_entries(DOMAIN)
-                        if candidate.entry_id == self._config_entry.entry_id
-                    ),
-                    None,
-                )
-                runtime_data = getattr(entry, "runtime_data", None) if entry else None
-                manager = getattr(runtime_data, "manager", None)
+                # The flow holds the registered entry itself; runtime_data is
+                # only missing when the entry is not loaded.
+                try:
+                    manager = self._config_entry.runtime_data.manager
+                except AttributeError:
+                    manager = None
                 if manager is not None:
                     await manager.async_rebuild_from_history()
             return self.async_create_entry(
                 title="",
                 data={
-                    CONF_ENABLED_LABELS: selected,
-                    CONF_RETENTION_HOURS: retention_hours,
-                    CONF_MAX_DETECTIONS: max_detections,
-                    CONF_MAX_STORAGE_GB: max_storage_gb,
+                    # A list, like the stored options, so unchanged submits compare equal.
+                    CONF_ENABLED_LABELS: list(submitted.labels),
+                    CONF_RETENTION_HOURS: submitted.retention_hours,
+                    CONF_MAX_DETECTIONS: submitted.max_detections,
+                    CONF_MAX_STORAGE_GB: submitted.max_storage_gb,
                 },
             )
 
-        existing = self._config_entry.options.get(CONF_ENABLED_LABELS)
-        if isinstance(existing, list):
-            default_labels = [label for label in existing if label in SUPPORTED_DETECTION_LABELS]
-        else:
-            default_labels = list(DEFAULT_ENABLED_DETECTION_LABELS)
-        if not default_labels:
-            default_labels = list(DEFAULT_ENABLED_DETECTION_LABELS)
-        retention_hours = _coerce_int(
-            self._config_entry.options.get(CONF_RETENTION_HOURS, DEFAULT_RETENTION_HOURS),
-            DEFAULT_RETENTION_HOURS,
-            MIN_RETENTION_HOURS,
-            MAX_RETENTION_HOURS,
-        )
-        max_detections = _coerce_int(
-            self._config_entry.options.get(CONF_MAX_DETECTIONS, DEFAULT_MAX_DETECTIONS),
-            DEFAULT_MAX_DETECTIONS,
-            MIN_MAX_DETECTIONS,
-            MAX_MAX_DETECTIONS,
-        )
-        max_storage_gb = _coerce_float(
-            self._config_entry.options.get(CONF_MAX_STORAGE_GB, DEFAULT_MAX_STORAGE_GB),
-            DEFAULT_MAX_STORAGE_GB,
-            MIN_MAX_STORAGE_GB,
-            MAX_MAX_STORAGE_GB,
+        options = self._options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_options_schema(
+                self._language_base(),
+                options.labels,
+                options.retention_hours,
+                options.max_detections,
+                options.max_storage_gb,
+            ),
         )
 
-        retention_section_schema = {
-            vol.Required(CONF_RETENTION_HOURS, default=retention_hours): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=MIN_RETENTION_HOURS,
-                    max=MAX_RETENTION_HOURS,
-                    step=1,
-                    mode=selector.NumberSelectorMode.BOX,
-                )
+    def _language_base(self) -> str:
+        return str(self.hass.config.language or "en").lower().split("-", 1)[0]
+
+
+@lru_cache(maxsize=32)
+def _options_schema(
+    language_base: str,
+    default_labels: tuple[str, ...],
+    retention_hours: int,
+    max_detections: int,
+    max_storage_gb: float,
+) -> vol.Schema:
+    # The form is re-rendered with the same defaults almost every time, so the
+    # compiled schema is shared per combination of defaults.
+    retention_section_schema = {
+        vol.Required(CONF_RETENTION_HOURS, default=retention_hours): _RETENTION_HOURS_SELECTOR,
+        vol.Required(CONF_MAX_DETECTIONS, default=max_detections): _MAX_DETECTIONS_SELECTOR,
+        vol.Required(CONF_MAX_STORAGE_GB, default=max_storage_gb): _MAX_STORAGE_GB_SELECTOR,
+    }
+    return vol.Schema(
+        {
+            vol.Required(CONF_ENABLED_LABELS, default=list(default_labels)): cv.multi_select(
+                dict(_label_options_for_language(language_base))
             ),
-            vol.Required(CONF_MAX_DETECTIONS, default=max_detections): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=MIN_MAX_DETECTIONS,
-                    max=MAX_MAX_DETECTIONS,
-                    step=1,
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Required(CONF_MAX_STORAGE_GB, default=max_storage_gb): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=MIN_MAX_STORAGE_GB,
-                    max=MAX_MAX_STORAGE_GB,
-                    step=0.1,
-                    mode=selector.NumberSelectorMode.BOX,
-                )
+            vol.Optional(CONF_REBUILD_NOW, default=False): _BOOLEAN_SELECTOR,
+            vol.Optional(SECTION_RETENTION_POLICY): section(
+                vol.Schema(retention_section_schema),
+                SectionConfig({"collapsed": False}),
             ),
         }
+    )
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_ENABLED_LABELS, default=default_labels): cv.multi_select(
-                        self._label_options()
-                    ),
-                    vol.Optional(CONF_REBUILD_NOW, default=False): selector.BooleanSelector(),
-                    vol.Optional(SECTION_RETENTION_POLICY): section(
-                        vol.Schema(retention_section_schema),
-                        SectionConfig({"collapsed": False}),
-                    ),
-                }
-            ),
-        )
 
-    def _label_options(self) -> dict[str, str]:
-        language = str(self.hass.config.language or "en").lower()
-        base = language.split("-")[0]
-        titles = _LABEL_TITLES.get(base, _LABEL_TITLES["en"])
-        return {label: titles.get(label, label.title()) for label in SUPPORTED_DETECTION_LABELS}
+@lru_cache(maxsize=32)
+def _label_options_for_language(base: str) -> tuple[tuple[str, str], ...]:
+    # Cached and shared across flows, so hand out immutable (label, title) pairs.
+    titles = _LABEL_TITLES.get(base, _LABEL_TITLES["en"])
+    return tuple(
+        (label, titles.get(label, label.title())) for label in SUPPORTED_DETECTION_LABELS
+    )
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+from typing import TypeVar
+
 DOMAIN = "reolink_feed"
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.items"
@@ -30,6 +33,9 @@ RECORDING_WINDOW_START_PAD_SECONDS = 35
 RECORDING_WINDOW_END_PAD_SECONDS = 30
 RECORDING_MAX_NEAREST_START_SECONDS = 180
 RECORDING_DEFAULT_CLIP_DURATION_SECONDS = 30
+# Shorter than the smallest gap between recording retries, so retries still see new clips.
+RECORDING_BROWSE_CACHE_SECONDS = 10.0
+RECORDING_BROWSE_CONCURRENCY = 4
 SUPPORTED_DETECTION_LABELS: tuple[str, ...] = (
     "person",
     "pet",
@@ -37,6 +43,7 @@ SUPPORTED_DETECTION_LABELS: tuple[str, ...] = (
     "motion",
     "visitor",
 )
+SUPPORTED_DETECTION_LABELS_SET: frozenset[str] = frozenset(SUPPORTED_DETECTION_LABELS)
 DEFAULT_ENABLED_DETECTION_LABELS: tuple[str, ...] = ("person", "visitor")
 LEGACY_LABEL_ALIASES: dict[str, str] = {
     "animal": "pet",
@@ -54,9 +61,24 @@ SUPPORTED_SUFFIX_TO_LABEL: dict[str, str] = {
     "_beweging": "motion",
     "_bezoeker": "visitor",
 }
+# Longest suffix first so the first endswith() hit is the most specific one.
+SUPPORTED_SUFFIX_TO_LABEL_ORDERED: tuple[tuple[str, str], ...] = tuple(
+    sorted(SUPPORTED_SUFFIX_TO_LABEL.items(), key=lambda pair: -len(pair[0]))
+)
+SUPPORTED_SUFFIXES: tuple[str, ...] = tuple(
+    suffix for suffix, _label in SUPPORTED_SUFFIX_TO_LABEL_ORDERED
+)
+
+
+_NumberT = TypeVar("_NumberT", int, float)
+
+
+def clamp_number(value: _NumberT, minimum: _NumberT, maximum: _NumberT) -> _NumberT:
+    """Clamp a numeric option into its allowed range."""
+    return minimum if value < minimum else maximum if value > maximum else value
 
 
 def normalize_detection_label(label: str | None) -> str:
     """Normalize user/entity label to canonical internal label."""
     lowered = str(label or "").strip().lower()
-    return LEGACY_LABEL_ALIASES.get(lowered, lowered)
+    return sys.intern(LEGACY_LABEL_ALIASES.get(lowered, lowered))
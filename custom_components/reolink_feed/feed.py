@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from datetime import date, datetime, timedelta, tzinfo
+from bisect import bisect_right, insort_left
+from collections import Counter
+from collections.abc import Callable, Coroutine, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta, tzinfo
+from functools import lru_cache
 import logging
+import math
 from pathlib import Path
 import re
 import shutil
-from typing import Any
+from stat import S_ISREG
+import sys
+import time
+from typing import Any, TypeVar
 import uuid
 
 from aiohttp import ClientError
@@ -19,11 +27,15 @@ from homeassistant.components.media_source import async_resolve_media
 from homeassistant.components.media_player import BrowseError
 from homeassistant.components.media_source import async_browse_media
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util import dt as dt_util
@@ -42,24 +54,58 @@ from .const import (
     MIN_MAX_DETECTIONS,
     MIN_MAX_STORAGE_GB,
     MIN_RETENTION_HOURS,
+    RECORDING_BROWSE_CACHE_SECONDS,
+    RECORDING_BROWSE_CONCURRENCY,
     RECORDING_DEFAULT_CLIP_DURATION_SECONDS,
     RECORDING_MAX_NEAREST_START_SECONDS,
     RECORDING_RETRY_DELAYS_SECONDS,
     RECORDING_WINDOW_END_PAD_SECONDS,
     RECORDING_WINDOW_START_PAD_SECONDS,
     SNAPSHOT_DELAY_SECONDS,
-    SUPPORTED_DETECTION_LABELS,
-    SUPPORTED_SUFFIX_TO_LABEL,
+    SUPPORTED_DETECTION_LABELS_SET,
+    SUPPORTED_SUFFIX_TO_LABEL_ORDERED,
+    SUPPORTED_SUFFIXES,
+    clamp_number,
     normalize_detection_label,
 )
 from .models import DetectionItem
 from .storage import DetectionStore
 
 _LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
 _CLIP_TITLE_PATTERN = re.compile(
-    r"^(?P<start>\d{1,2}:\d{2}:\d{2})(?:\s+(?P<duration>\d+:\d{2}:\d{2}))?"
+    r"^(?P<hour>\d{1,2}):(?P<minute>\d{2}):(?P<second>\d{2})"
+    r"(?:\s+(?P<duration>\d+:\d{2}:\d{2}))?"
 )
 _CACHE_DOWNLOAD_RETRY_DELAYS_SECONDS: tuple[float, ...] = (0.0, 2.0, 5.0)
+_MERGE_WINDOW = timedelta(seconds=MERGE_WINDOW_SECONDS)
+# (from, to) state edge -> whether it starts a detection.
+_DETECTION_EDGE_STARTS: dict[tuple[str | None, str | None], bool] = {
+    (STATE_OFF, STATE_ON): True,
+    (STATE_ON, STATE_OFF): False,
+}
+_DUMMY_SVG_HEAD = (
+    b"<svg xmlns='http://www.w3.org/2000/svg' width='640' height='360'>"
+    b"<defs><linearGradient id='bg' x1='0' y1='0' x2='1' y2='1'>"
+    b"<stop offset='0%' stop-color='#1d3557'/>"
+    b"<stop offset='100%' stop-color='#457b9d'/>"
+    b"</linearGradient></defs>"
+    b"<rect width='100%' height='100%' fill='url(#bg)'/>"
+)
+_DUMMY_SVG_TAIL = b"</svg>"
+_FRIENDLY_NAME_LABEL_SUFFIXES: tuple[str, ...] = (
+    " persoon",
+    " dier",
+    " bezoeker",
+    " voertuig",
+    " beweging",
+    " person",
+    " animal",
+    " pet",
+    " visitor",
+    " vehicle",
+    " motion",
+)
 
 
 class RecordingMatch:
@@ -82,7 +128,7 @@ class ReolinkFeedManager:
     def __init__(
         self,
         hass: HomeAssistant,
-        enabled_labels: set[str] | None = None,
+        enabled_labels: set[str] | frozenset[str] | None = None,
         retention_hours: int | None = None,
         max_detections: int | None = None,
         max_storage_gb: float | None = None,
@@ -92,17 +138,40 @@ class ReolinkFeedManager:
         self._www_root = Path(hass.config.path("www"))
         self._items: list[DetectionItem] = []
         self._item_by_id: dict[str, DetectionItem] = {}
-        self._open_item_id_by_key: dict[tuple[str, str], str] = {}
-        self._last_closed_item_id_by_key: dict[tuple[str, str], str] = {}
+        self._label_counts: dict[str, int] = {}
+        self._items_version = 0
+        self._saved_items_version = 0
+        self._snapshot_paths_migrated = False
+        self._next_prune_ts = 0.0
+        self._open_item_by_key: dict[tuple[str, str], DetectionItem] = {}
+        self._last_closed_item_by_key: dict[tuple[str, str], DetectionItem] = {}
         self._asset_size_by_item_id: dict[str, int] = {}
         self._total_asset_size_bytes = 0
+        # Set when items arrive without a cached asset size, or when removals and
+        # refreshes race a running sync; otherwise removals keep the index in step.
+        self._storage_index_dirty = True
+        self._storage_sync_in_flight = False
         self._snapshot_camera_by_sensor: dict[str, str | None] = {}
+        self._camera_by_device: dict[str, str | None] = {}
         self._label_by_sensor: dict[str, str | None] = {}
+        self._browse_cache: dict[str, tuple[float, Any]] = {}
+        self._browse_tasks: dict[str, asyncio.Task[Any]] = {}
+        # Detection sensors whose state changes are subscribed to.
+        self._tracked_entity_ids: set[str] = set()
+        # entity_id -> (friendly name it was derived from, shared (camera, label) key).
+        self._detection_key_by_sensor: dict[str, tuple[str, tuple[str, str]]] = {}
         self._unsub_snapshot_timers: dict[str, Callable[[], None]] = {}
-        self._unsub_recording_timers: dict[str, list[Callable[[], None]]] = {}
+        self._unsub_recording_timers: dict[str, Callable[[], None]] = {}
         self._unsub_state_changed: Callable[[], None] | None = None
+        self._unsub_registry_updated: Callable[[], None] | None = None
+        self._unsub_state_added: Callable[[], None] | None = None
         self._unsub_delayed_save: Callable[[], None] | None = None
         self._unsub_cleanup_timer: Callable[[], None] | None = None
+        # Snapshot and recording writes get their own threads so bursts of large
+        # files do not tie up Home Assistant's shared executor.
+        self._asset_write_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="reolink_feed_assets"
+        )
         self._enabled_labels = self._normalize_enabled_labels(enabled_labels)
         self._retention_hours = self._normalize_retention_hours(retention_hours)
         self._max_detections = self._normalize_max_detections(max_detections)
@@ -112,11 +181,13 @@ class ReolinkFeedManager:
     async def async_start(self) -> None:
         """Load initial state and begin listening."""
         self._items = await self._store.async_load()
+        self._items.sort(key=_newest_first_key)
         changed = self._normalize_item_labels()
         if self._normalize_item_recordings():
             changed = True
         if await self._async_migrate_snapshot_paths():
             changed = True
+        self._snapshot_paths_migrated = True
         if await self.async_prune_expired_items():
             changed = True
         trimmed = await self._async_trim_to_max_detections()
@@ -127,18 +198,25 @@ class ReolinkFeedManager:
         if storage_trimmed:
             changed = True
         self._rebuild_indexes()
-        self._unsub_state_changed = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._async_handle_state_changed
+        self._unsub_registry_updated = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_handle_registry_updated
+        )
+        # Registry-less sensors never fire a registry event; catch them as their state appears.
+        self._unsub_state_added = async_track_state_added_domain(
+            self.hass, "binary_sensor", self._async_handle_state_added
         )
+        self._track_detection_sensors()
         self._schedule_cleanup()
         if changed:
-            await self._store.async_save(self._items)
+            await self._async_save_items()
+        else:
+            self._saved_items_version = self._items_version
 
     def _trim_to_max_detections(self) -> list[DetectionItem]:
         if len(self._items) <= self._max_detections:
             return []
         removed = self._items[self._max_detections :]
-        self._items = self._items[: self._max_detections]
+        del self._items[self._max_detections :]
         return removed
 
     async def _async_trim_to_max_detections(self) -> int:
@@ -157,23 +235,24 @@ class ReolinkFeedManager:
         if self._max_storage_bytes <= 0 or not self._items:
             return 0
 
-        await self._async_sync_storage_usage_index()
+        if self._storage_index_dirty:
+            await self._async_sync_storage_usage_index()
         total_size = self._total_asset_size_bytes
 
         if total_size <= self._max_storage_bytes:
             return 0
 
-        kept = list(self._items)
-        removed: list[DetectionItem] = []
-        while total_size > self._max_storage_bytes and kept:
-            candidate = kept.pop()  # oldest-first removal
-            removed.append(candidate)
-            total_size -= self._asset_size_by_item_id.get(candidate.id, 0)
+        # Walk back from the oldest item until the remaining assets fit the budget.
+        cut = len(self._items)
+        while total_size > self._max_storage_bytes and cut > 0:
+            cut -= 1
+            total_size -= self._asset_size_by_item_id.get(self._items[cut].id, 0)
 
+        removed = self._items[cut:]
         if not removed:
             return 0
 
-        self._items = kept
+        del self._items[cut:]
         removed_count = await self._async_remove_items(removed)
         _LOGGER.info(
             "Trimmed %s reolink feed items to enforce max_storage_gb=%s",
@@ -184,6 +263,7 @@ class ReolinkFeedManager:
 
     async def _async_sync_storage_usage_index(self) -> None:
         """Sync cached asset sizes for current items without full rescans."""
+        self._storage_index_dirty = False
         current_ids = {item.id for item in self._items}
         for item_id in list(self._asset_size_by_item_id):
             if item_id in current_ids:
@@ -192,15 +272,28 @@ class ReolinkFeedManager:
         if self._total_asset_size_bytes < 0:
             self._total_asset_size_bytes = 0
 
-        for item in self._items:
-            if item.id in self._asset_size_by_item_id:
-                continue
-            paths = [
+        paths_by_item_id = {
+            item.id: [
                 *_snapshot_paths_for_item(self.hass, self._www_root, item),
                 *_cached_recording_paths_for_item(self._www_root, item),
             ]
-            item_size = await self.hass.async_add_executor_job(_sum_existing_file_sizes, paths)
-            self._asset_size_by_item_id[item.id] = item_size
+            for item in self._items
+            if item.id not in self._asset_size_by_item_id
+        }
+        if not paths_by_item_id:
+            return
+        # One executor hop for the whole batch; a cold start can have thousands of items.
+        self._storage_sync_in_flight = True
+        try:
+            sizes = await self.hass.async_add_executor_job(
+                _sum_existing_file_sizes_by_item, paths_by_item_id
+            )
+        finally:
+            self._storage_sync_in_flight = False
+        for item_id, item_size in sizes.items():
+            if item_id in self._asset_size_by_item_id:
+                continue
+            self._asset_size_by_item_id[item_id] = item_size
             self._total_asset_size_bytes += item_size
 
     async def _async_refresh_item_asset_size(self, item: DetectionItem) -> int:
@@ -210,6 +303,8 @@ class ReolinkFeedManager:
             *_cached_recording_paths_for_item(self._www_root, item),
         ]
         item_size = await self.hass.async_add_executor_job(_sum_existing_file_sizes, paths)
+        if self._storage_sync_in_flight:
+            self._storage_index_dirty = True
         previous = self._asset_size_by_item_id.get(item.id, 0)
         self._asset_size_by_item_id[item.id] = item_size
         self._total_asset_size_bytes += item_size - previous
@@ -220,7 +315,7 @@ class ReolinkFeedManager:
     async def _async_remove_items(
         self, items: list[DetectionItem], *, save: bool = True
     ) -> int:
-        """Remove items, clean up timers/assets, rebuild indexes, optionally persist."""
+        """Clean up timers, assets and indexes for items already cut from _items."""
         if not items:
             return 0
 
@@ -240,12 +335,15 @@ class ReolinkFeedManager:
             self._total_asset_size_bytes -= self._asset_size_by_item_id.pop(item_id, 0)
         if self._total_asset_size_bytes < 0:
             self._total_asset_size_bytes = 0
+        if self._storage_sync_in_flight:
+            # The running sync may still add sizes for these ids; the next sync drops them.
+            self._storage_index_dirty = True
 
-        self._items = [item for item in self._items if item.id not in seen_ids]
+        self._unindex_items(unique_items)
+        self._mark_items_changed()
         await self._async_delete_snapshots_for_items(unique_items)
-        self._rebuild_indexes()
         if save:
-            await self._store.async_save(self._items)
+            await self._async_save_items()
         return len(unique_items)
 
     def _normalize_item_labels(self) -> bool:
@@ -273,28 +371,61 @@ class ReolinkFeedManager:
         if self._unsub_state_changed:
             self._unsub_state_changed()
             self._unsub_state_changed = None
-        if self._unsub_delayed_save:
-            self._unsub_delayed_save()
-            self._unsub_delayed_save = None
+        if self._unsub_registry_updated:
+            self._unsub_registry_updated()
+            self._unsub_registry_updated = None
+        if self._unsub_state_added:
+            self._unsub_state_added()
+            self._unsub_state_added = None
         if self._unsub_cleanup_timer:
             self._unsub_cleanup_timer()
             self._unsub_cleanup_timer = None
         for unsub in self._unsub_snapshot_timers.values():
             unsub()
         self._unsub_snapshot_timers.clear()
-        for timer_unsubs in self._unsub_recording_timers.values():
-            for unsub in timer_unsubs:
-                unsub()
+        for unsub in self._unsub_recording_timers.values():
+            unsub()
         self._unsub_recording_timers.clear()
+        for task in self._browse_tasks.values():
+            task.cancel()
+        self._browse_tasks.clear()
+        await self.async_flush()
+        # Let in-flight asset writes finish without blocking the event loop.
+        await self.hass.async_add_executor_job(self._asset_write_executor.shutdown)
+
+    async def async_flush(self) -> None:
+        """Write items now, replacing any pending delayed save."""
+        if self._unsub_delayed_save:
+            self._unsub_delayed_save()
+            self._unsub_delayed_save = None
+        if self._items_version != self._saved_items_version:
+            await self._async_save_items()
+
+    async def _async_save_items(self) -> None:
+        self._saved_items_version = self._items_version
         await self._store.async_save(self._items)
 
     def get_items(self) -> list[DetectionItem]:
         """Return newest-first feed items."""
         return self._items
 
-    def get_enabled_labels(self) -> set[str]:
+    def has_items_with_labels(self, labels: frozenset[str]) -> bool:
+        """Return whether any feed item carries one of the given labels."""
+        return any(self._label_counts.get(label) for label in labels)
+
+    def get_items_version(self) -> int:
+        """Return a counter that changes whenever feed items change."""
+        return self._items_version
+
+    def get_items_newer_than(self, cutoff_ts: float) -> list[DetectionItem]:
+        """Return newest-first feed items that started at or after cutoff_ts."""
+        # _insert_item and async_start keep items newest-first, so negated start epochs ascend.
+        end = bisect_right(self._items, -cutoff_ts, key=_newest_first_key)
+        return self._items[:end]
+
+    def get_enabled_labels(self) -> frozenset[str]:
         """Return backend-enabled detection labels."""
-        return set(self._enabled_labels)
+        return self._enabled_labels
 
     def get_retention_hours(self) -> int:
         """Return retention window in hours."""
@@ -308,12 +439,15 @@ class ReolinkFeedManager:
         """Return max local asset storage in GB."""
         return self._max_storage_gb
 
-    def _normalize_enabled_labels(self, enabled_labels: set[str] | None) -> set[str]:
+    def _normalize_enabled_labels(
+        self, enabled_labels: set[str] | frozenset[str] | None
+    ) -> frozenset[str]:
         if not enabled_labels:
-            return set(DEFAULT_ENABLED_DETECTION_LABELS)
+            return frozenset(DEFAULT_ENABLED_DETECTION_LABELS)
         normalized = {normalize_detection_label(label) for label in enabled_labels}
-        normalized = {label for label in normalized if label in SUPPORTED_DETECTION_LABELS}
-        return normalized or set(DEFAULT_ENABLED_DETECTION_LABELS)
+        return frozenset(
+            label for label in normalized if label in SUPPORTED_DETECTION_LABELS_SET
+        ) or frozenset(DEFAULT_ENABLED_DETECTION_LABELS)
 
     def _normalize_retention_hours(self, retention_hours: int | None) -> int:
         if retention_hours is None:
@@ -322,7 +456,7 @@ class ReolinkFeedManager:
             value = int(retention_hours)
         except (TypeError, ValueError):
             value = DEFAULT_RETENTION_HOURS
-        return max(MIN_RETENTION_HOURS, min(MAX_RETENTION_HOURS, value))
+        return clamp_number(value, MIN_RETENTION_HOURS, MAX_RETENTION_HOURS)
 
     def _normalize_max_detections(self, max_detections: int | None) -> int:
         if max_detections is None:
@@ -331,7 +465,7 @@ class ReolinkFeedManager:
             value = int(max_detections)
         except (TypeError, ValueError):
             value = DEFAULT_MAX_DETECTIONS
-        return max(MIN_MAX_DETECTIONS, min(MAX_MAX_DETECTIONS, value))
+        return clamp_number(value, MIN_MAX_DETECTIONS, MAX_MAX_DETECTIONS)
 
     def _normalize_max_storage_gb(self, max_storage_gb: float | None) -> float:
         if max_storage_gb is None:
@@ -340,16 +474,21 @@ class ReolinkFeedManager:
             value = float(max_storage_gb)
         except (TypeError, ValueError):
             value = float(DEFAULT_MAX_STORAGE_GB)
-        return max(MIN_MAX_STORAGE_GB, min(MAX_MAX_STORAGE_GB, value))
+        return clamp_number(value, MIN_MAX_STORAGE_GB, MAX_MAX_STORAGE_GB)
 
     def _label_is_enabled(self, label: str | None) -> bool:
         return normalize_detection_label(label) in self._enabled_labels
 
     async def async_migrate_legacy_snapshot_urls(self) -> bool:
         """Public migration trigger for legacy snapshot URLs."""
+        if self._snapshot_paths_migrated:
+            # Legacy URLs only come from stored data, which async_start already migrated.
+            return False
         changed = await self._async_migrate_snapshot_paths()
+        self._snapshot_paths_migrated = True
         if changed:
-            await self._store.async_save(self._items)
+            self._mark_items_changed()
+            await self._async_save_items()
         return changed
 
     async def async_enforce_storage_limit(self) -> int:
@@ -358,19 +497,30 @@ class ReolinkFeedManager:
 
     async def async_prune_expired_items(self) -> int:
         """Drop items older than retention window and remove local assets."""
-        cutoff = dt_util.utcnow() - timedelta(hours=self._retention_hours)
-        kept: list[DetectionItem] = []
-        removed: list[DetectionItem] = []
-        for item in self._items:
-            if item.start_dt.astimezone(dt_util.UTC) < cutoff:
-                removed.append(item)
-            else:
-                kept.append(item)
+        now_ts = time.time()
+        if now_ts < self._next_prune_ts:
+            return 0
 
+        retention_seconds = self._retention_hours * 3600
+        cutoff_ts = now_ts - retention_seconds
+        # Newest-first order puts every expired item in one tail slice. Check each
+        # item anyway: if that order were ever broken, fresh items must survive.
+        kept_count = len(self.get_items_newer_than(cutoff_ts))
+        removed = self._items[kept_count:]
+        if all(item.start_epoch < cutoff_ts for item in removed):
+            del self._items[kept_count:]
+        else:
+            _LOGGER.debug("Feed items out of start order; pruning item by item")
+            kept = [item for item in self._items if item.start_epoch >= cutoff_ts]
+            removed = [item for item in self._items if item.start_epoch < cutoff_ts]
+            kept.sort(key=_newest_first_key)
+            self._items = kept
+        self._next_prune_ts = (
+            self._items[-1].start_epoch if self._items else math.inf
+        ) + retention_seconds
         if not removed:
             return 0
 
-        self._items = kept
         removed_count = await self._async_remove_items(removed)
         _LOGGER.info("Pruned %s expired reolink feed items", removed_count)
         return removed_count
@@ -381,6 +531,7 @@ class ReolinkFeedManager:
         if item is None:
             raise ValueError(f"Unknown item id: {item_id}")
 
+        self._items.remove(item)
         await self._async_remove_items([item])
 
     def _schedule_cleanup(self) -> None:
@@ -415,9 +566,13 @@ class ReolinkFeedManager:
         )
         merged.sort(key=lambda item: item.start_dt, reverse=True)
         self._items = merged
-        await self._async_trim_to_max_detections()
+        # Reindex before any await so the trim and live detections see the new objects.
         self._rebuild_indexes()
-        await self._store.async_save(self._items)
+        self._storage_index_dirty = True
+        self._next_prune_ts = 0.0
+        self._mark_items_changed()
+        await self._async_trim_to_max_detections()
+        await self._async_save_items()
 
         resolvable_ids = {
             item.id
@@ -426,7 +581,8 @@ class ReolinkFeedManager:
         }
         pending_rebuild_items = [item for item in self._items if item.id in resolvable_ids]
         await self._async_cache_recordings_for_items(pending_rebuild_items)
-        await self._store.async_save(self._items)
+        self._mark_items_changed()
+        await self._async_save_items()
         return {
             "entity_count": len(entity_ids),
             "item_count": len(self._items),
@@ -435,29 +591,55 @@ class ReolinkFeedManager:
         }
 
     def _rebuild_indexes(self) -> None:
-        self._item_by_id.clear()
-        self._open_item_id_by_key.clear()
-        self._last_closed_item_id_by_key.clear()
+        items = self._items
+        self._item_by_id = {item.id: item for item in items}
+        self._label_counts = Counter(item.label for item in items)
+        # Later entries win: the oldest open item, and (walking oldest-first) the newest closed one.
+        self._open_item_by_key = {
+            (item.camera_name, item.label): item for item in items if item.end_ts is None
+        }
+        self._last_closed_item_by_key = {
+            (item.camera_name, item.label): item
+            for item in reversed(items)
+            if item.end_ts is not None
+        }
 
+    def _unindex_items(self, removed: list[DetectionItem]) -> None:
+        """Drop items already cut from _items out of the indexes, without a full rebuild."""
+        stale_open: set[tuple[str, str]] = set()
+        stale_closed: set[tuple[str, str]] = set()
+        for item in removed:
+            if self._item_by_id.get(item.id) is not item:
+                continue
+            del self._item_by_id[item.id]
+            remaining = self._label_counts.get(item.label, 0) - 1
+            if remaining > 0:
+                self._label_counts[item.label] = remaining
+            else:
+                self._label_counts.pop(item.label, None)
+            key = (item.camera_name, item.label)
+            if self._open_item_by_key.get(key) is item:
+                del self._open_item_by_key[key]
+                stale_open.add(key)
+            if self._last_closed_item_by_key.get(key) is item:
+                del self._last_closed_item_by_key[key]
+                stale_closed.add(key)
+
+        if not stale_open and not stale_closed:
+            return
+        # Re-pick only the affected keys, with the same rules as _rebuild_indexes.
         for item in self._items:
-            self._item_by_id[item.id] = item
             key = (item.camera_name, item.label)
             if item.end_ts is None:
-                self._open_item_id_by_key[key] = item.id
-            elif key not in self._last_closed_item_id_by_key:
-                self._last_closed_item_id_by_key[key] = item.id
+                if key in stale_open:
+                    self._open_item_by_key[key] = item
+            elif key in stale_closed:
+                self._last_closed_item_by_key[key] = item
+                stale_closed.discard(key)
 
     @callback
     def _async_handle_state_changed(self, event: Event[EventStateChangedData]) -> None:
         data = event.data
-        entity_id = data["entity_id"]
-        if not entity_id.startswith("binary_sensor."):
-            return
-
-        label = self._resolve_detection_label(entity_id)
-        if label is None or not self._label_is_enabled(label):
-            return
-
         old_state = data.get("old_state")
         new_state = data.get("new_state")
         if old_state is None or new_state is None:
@@ -465,17 +647,31 @@ class ReolinkFeedManager:
 
         from_state = old_state.state if old_state.state is not UNDEFINED else None
         to_state = new_state.state if new_state.state is not UNDEFINED else None
+        # Attribute-only updates and unavailable/unknown hops are not detection edges.
+        starts = _DETECTION_EDGE_STARTS.get((from_state, to_state))
+        if starts is None:
+            return
 
-        camera_name = _camera_name_from_state(entity_id, new_state.name)
-        key = (camera_name, label)
+        entity_id = data["entity_id"]
+        label = self._resolve_detection_label(entity_id)
+        if label is None or not self._label_is_enabled(label):
+            return
+
+        friendly_name = new_state.name
+        cached_key = self._detection_key_by_sensor.get(entity_id)
+        if cached_key is not None and cached_key[0] == friendly_name:
+            key = cached_key[1]
+        else:
+            key = (sys.intern(_camera_name_from_state(entity_id, friendly_name)), label)
+            self._detection_key_by_sensor[entity_id] = (friendly_name, key)
+        camera_name = key[0]
         fired_at = event.time_fired
 
-        if from_state == "off" and to_state == "on":
+        if starts:
             self._handle_detection_start(key, entity_id, camera_name, label, fired_at)
             return
 
-        if from_state == "on" and to_state == "off":
-            self._handle_detection_end(key, fired_at)
+        self._handle_detection_end(key, fired_at)
 
     def _handle_detection_start(
         self,
@@ -485,21 +681,22 @@ class ReolinkFeedManager:
         label: str,
         fired_at: datetime,
     ) -> None:
-        if key in self._open_item_id_by_key:
+        if key in self._open_item_by_key:
             return
 
-        last_closed = self._get_item_by_id(self._last_closed_item_id_by_key.get(key))
+        # Removals unindex their items (_unindex_items), so both key maps only hold live items.
+        last_closed = self._last_closed_item_by_key.get(key)
         if (
             last_closed is not None
             and last_closed.end_dt is not None
-            and fired_at - last_closed.end_dt <= timedelta(seconds=MERGE_WINDOW_SECONDS)
+            and fired_at - last_closed.end_dt <= _MERGE_WINDOW
         ):
             last_closed.end_ts = None
             last_closed.duration_s = None
             last_closed.recording = {"status": "pending"}
             self._cancel_recording_resolution(last_closed.id)
-            self._open_item_id_by_key[key] = last_closed.id
-            self._last_closed_item_id_by_key.pop(key, None)
+            self._open_item_by_key[key] = last_closed
+            self._last_closed_item_by_key.pop(key, None)
             self._schedule_save()
             return
 
@@ -514,24 +711,22 @@ class ReolinkFeedManager:
             snapshot_url=None,
             recording={"status": "pending"},
         )
-        self._items.insert(0, item)
-        self._item_by_id[item.id] = item
-        self._open_item_id_by_key[key] = item.id
+        self._insert_item(item)
+        self._open_item_by_key[key] = item
         removed = self._trim_to_max_detections()
         if removed:
-            self._rebuild_indexes()
+            self._unindex_items(removed)
             self.hass.async_create_task(self._async_remove_items(removed, save=False))
         self._schedule_save()
         self._schedule_snapshot_capture(item.id, entity_id)
 
     def _handle_detection_end(self, key: tuple[str, str], fired_at: datetime) -> None:
-        item = self._get_item_by_id(self._open_item_id_by_key.get(key))
+        item = self._open_item_by_key.pop(key, None)
         if item is None:
             return
         item.end_ts = fired_at.isoformat()
         item.duration_s = max(0, int((fired_at - item.start_dt).total_seconds()))
-        self._open_item_id_by_key.pop(key, None)
-        self._last_closed_item_id_by_key[key] = item.id
+        self._last_closed_item_by_key[key] = item
         self._schedule_save()
         self._schedule_recording_resolution(item.id)
 
@@ -540,15 +735,35 @@ class ReolinkFeedManager:
             return None
         return self._item_by_id.get(item_id)
 
+    def _insert_item(self, item: DetectionItem) -> None:
+        """Add an item in newest-first position and keep the lookup indexes in step."""
+        # Mock detections start in the past, so "new" does not always mean "newest".
+        insort_left(self._items, item, key=_newest_first_key)
+        self._item_by_id[item.id] = item
+        self._storage_index_dirty = True
+        self._label_counts[item.label] = self._label_counts.get(item.label, 0) + 1
+        self._track_item_expiry(item)
+
+    def _track_item_expiry(self, item: DetectionItem) -> None:
+        self._next_prune_ts = min(
+            self._next_prune_ts, item.start_epoch + self._retention_hours * 3600
+        )
+
+    def _mark_items_changed(self) -> None:
+        self._items_version += 1
+
     def _schedule_save(self) -> None:
+        self._mark_items_changed()
+        # A pending save already covers this change; leaving the timer alone
+        # coalesces a detection burst into one write at most a second late.
         if self._unsub_delayed_save is not None:
-            self._unsub_delayed_save()
-            self._unsub_delayed_save = None
+            return
 
         @callback
         def _save_callback(_now: datetime) -> None:
             self._unsub_delayed_save = None
-            self.hass.async_create_task(self._store.async_save(self._items))
+            if self._items_version != self._saved_items_version:
+                self.hass.async_create_task(self._async_save_items())
 
         self._unsub_delayed_save = async_call_later(self.hass, 1.0, _save_callback)
 
@@ -562,7 +777,7 @@ class ReolinkFeedManager:
     ) -> DetectionItem:
         """Create a synthetic detection for local development/testing."""
         normalized_label = normalize_detection_label(label)
-        if normalized_label not in SUPPORTED_DETECTION_LABELS:
+        if normalized_label not in SUPPORTED_DETECTION_LABELS_SET:
             raise ValueError(f"Unsupported label: {label}")
         if not self._label_is_enabled(normalized_label):
             raise ValueError(f"Label is disabled by options: {normalized_label}")
@@ -585,12 +800,15 @@ class ReolinkFeedManager:
             snapshot_url = await self._async_write_dummy_snapshot(item)
             item.snapshot_url = snapshot_url
 
-        self._items.insert(0, item)
+        self._insert_item(item)
+        # Set before trimming so a removal can still drop it from the index.
+        self._last_closed_item_by_key[(camera_name, normalized_label)] = item
         await self._async_trim_to_max_detections()
         await self._async_enforce_storage_limit()
-        self._last_closed_item_id_by_key[(camera_name, normalized_label)] = item.id
         self._schedule_save()
-        self._schedule_recording_resolution(item.id)
+        # A mock older than a full feed sorts last and is trimmed straight away.
+        if self._get_item_by_id(item.id) is item:
+            self._schedule_recording_resolution(item.id)
         return item
 
     async def async_resolve_recording(self, item_id: str, *, final_attempt: bool = False) -> dict:
@@ -712,37 +930,88 @@ class ReolinkFeedManager:
         if existing is not None:
             existing()
 
+        # A bare loop timer: this fires once per detection and needs no HassJob or closure.
+        handle = self.hass.loop.call_later(
+            SNAPSHOT_DELAY_SECONDS, self._start_snapshot_capture, item_id, source_entity_id
+        )
+        self._unsub_snapshot_timers[item_id] = handle.cancel
+
+    @callback
+    def _start_snapshot_capture(self, item_id: str, source_entity_id: str) -> None:
+        self._unsub_snapshot_timers.pop(item_id, None)
+        self.hass.async_create_task(self._async_capture_snapshot(item_id, source_entity_id))
+
+    def _schedule_recording_resolution(self, item_id: str) -> None:
+        self._cancel_recording_resolution(item_id)
+        self._arm_recording_retry(item_id, 0)
+
+    def _arm_recording_retry(self, item_id: str, attempt: int) -> None:
+        """Keep a single timer per item, chained through the retry schedule."""
+        previous_delay = RECORDING_RETRY_DELAYS_SECONDS[attempt - 1] if attempt else 0
+        delay_s = RECORDING_RETRY_DELAYS_SECONDS[attempt] - previous_delay
+        is_final = attempt == len(RECORDING_RETRY_DELAYS_SECONDS) - 1
+
         @callback
-        def _capture_callback(_now: datetime) -> None:
-            self._unsub_snapshot_timers.pop(item_id, None)
+        def _resolve_callback(_now: datetime) -> None:
+            # Arm the next attempt first so retries keep their original spacing
+            # regardless of how long this resolve takes.
+            if is_final:
+                self._unsub_recording_timers.pop(item_id, None)
+            else:
+                self._arm_recording_retry(item_id, attempt + 1)
             self.hass.async_create_task(
-                self._async_capture_snapshot(item_id, source_entity_id)
+                self.async_resolve_recording(item_id, final_attempt=is_final)
             )
 
-        self._unsub_snapshot_timers[item_id] = async_call_later(
-            self.hass, SNAPSHOT_DELAY_SECONDS, _capture_callback
+        self._unsub_recording_timers[item_id] = async_call_later(
+            self.hass, float(delay_s), _resolve_callback
         )
 
-    def _schedule_recording_resolution(self, item_id: str) -> None:
-        self._cancel_recording_resolution(item_id)
-        timer_unsubs: list[Callable[[], None]] = []
+    async def _async_browse_media_cached(self, media_content_id: str) -> Any:
+        """Browse a media-source node, reusing listings fetched moments ago."""
+        now = self.hass.loop.time()
+        cached = self._browse_cache.get(media_content_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        # Items closing together resolve against the same day folders; share one browse.
+        listing = await async_await_shared_task(
+            self.hass,
+            self._browse_tasks,
+            media_content_id,
+            lambda: async_browse_media(self.hass, media_content_id),
+        )
+        self._browse_cache = {
+            content_id: entry
+            for content_id, entry in self._browse_cache.items()
+            if entry[0] > now
+        }
+        self._browse_cache[media_content_id] = (now + RECORDING_BROWSE_CACHE_SECONDS, listing)
+        return listing
 
-        for index, delay_s in enumerate(RECORDING_RETRY_DELAYS_SECONDS):
+    async def _async_browse_media_many(
+        self, media_content_ids: list[str]
+    ) -> list[Any | BrowseError | HomeAssistantError]:
+        """Browse sibling nodes concurrently; browse failures are returned in place."""
+        semaphore = asyncio.Semaphore(RECORDING_BROWSE_CONCURRENCY)
 
-            @callback
-            def _resolve_callback(_now: datetime, idx: int = index) -> None:
-                is_final = idx == len(RECORDING_RETRY_DELAYS_SECONDS) - 1
-                self.hass.async_create_task(
-                    self.async_resolve_recording(item_id, final_attempt=is_final)
-                )
-
-            timer_unsubs.append(async_call_later(self.hass, float(delay_s), _resolve_callback))
+        async def _browse(media_content_id: str) -> Any:
+            async with semaphore:
+                return await self._async_browse_media_cached(media_content_id)
 
-        self._unsub_recording_timers[item_id] = timer_unsubs
+        results = await asyncio.gather(
+            *(_browse(media_content_id) for media_content_id in media_content_ids),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, (BrowseError, HomeAssistantError)
+            ):
+                raise result
+        return results
 
     def _cancel_recording_resolution(self, item_id: str) -> None:
-        timer_unsubs = self._unsub_recording_timers.pop(item_id, [])
-        for unsub in timer_unsubs:
+        unsub = self._unsub_recording_timers.pop(item_id, None)
+        if unsub is not None:
             unsub()
 
     async def _async_capture_snapshot(self, item_id: str, source_entity_id: str) -> None:
@@ -772,7 +1041,7 @@ class ReolinkFeedManager:
         absolute = self._www_root / relative
 
         try:
-            await self.hass.async_add_executor_job(_write_snapshot_file, absolute, image.content)
+            await self._async_write_asset(_write_snapshot_file, absolute, image.content)
         except Exception as err:  # noqa: BLE001
             _LOGGER.warning("Failed to persist snapshot %s: %s", absolute, err)
             return
@@ -794,23 +1063,26 @@ class ReolinkFeedManager:
         window_start = start_dt - timedelta(seconds=RECORDING_WINDOW_START_PAD_SECONDS)
         window_end = end_dt + timedelta(seconds=RECORDING_WINDOW_END_PAD_SECONDS)
 
-        day_candidates = {
-            window_start.date(),
-            start_dt.date(),
-            end_dt.date(),
-            window_end.date(),
-        }
-        _LOGGER.debug(
-            "Browse lookup for item %s (camera=%s label=%s days=%s window=%s..%s)",
-            item.id,
-            item.camera_name,
-            item.label,
-            sorted(str(day) for day in day_candidates),
-            window_start.isoformat(),
-            window_end.isoformat(),
+        first_day = window_start.date()
+        last_day = window_end.date()
+        # The padded window brackets the event, so one date at both ends covers everything.
+        day_candidates = (
+            {first_day}
+            if first_day == last_day
+            else {first_day, start_dt.date(), end_dt.date(), last_day}
         )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Browse lookup for item %s (camera=%s label=%s days=%s window=%s..%s)",
+                item.id,
+                item.camera_name,
+                item.label,
+                sorted(str(day) for day in day_candidates),
+                window_start.isoformat(),
+                window_end.isoformat(),
+            )
         try:
-            root = await async_browse_media(self.hass, "media-source://reolink")
+            root = await self._async_browse_media_cached("media-source://reolink")
         except (BrowseError, HomeAssistantError) as err:
             _LOGGER.debug("Unable to browse reolink media root: %s", err)
             return None
@@ -827,7 +1099,7 @@ class ReolinkFeedManager:
         )
 
         try:
-            resolution_root = await async_browse_media(self.hass, camera_node.media_content_id)
+            resolution_root = await self._async_browse_media_cached(camera_node.media_content_id)
         except (BrowseError, HomeAssistantError) as err:
             _LOGGER.debug(
                 "Unable to browse reolink camera node for item %s (%s): %s",
@@ -849,7 +1121,7 @@ class ReolinkFeedManager:
         )
 
         try:
-            days_root = await async_browse_media(self.hass, resolution_node.media_content_id)
+            days_root = await self._async_browse_media_cached(resolution_node.media_content_id)
         except (BrowseError, HomeAssistantError) as err:
             _LOGGER.debug(
                 "Unable to browse reolink day root for item %s (%s): %s",
@@ -865,17 +1137,23 @@ class ReolinkFeedManager:
         debug_logged = 0
         debug_suppressed = 0
         debug_cap = 60
-        for day_node, day in day_nodes:
-            if not day_node.media_content_id:
-                continue
-            try:
-                day_listing = await async_browse_media(self.hass, day_node.media_content_id)
-            except (BrowseError, HomeAssistantError) as err:
+        start_tz = start_dt.tzinfo
+        # Score clips on epoch floats; datetime arithmetic allocates a timedelta per step.
+        start_s = start_dt.timestamp()
+        end_s = end_dt.timestamp()
+        window_start_s = window_start.timestamp()
+        window_end_s = window_end.timestamp()
+        day_nodes = [(day_node, day) for day_node, day in day_nodes if day_node.media_content_id]
+        day_listings = await self._async_browse_media_many(
+            [day_node.media_content_id for day_node, _day in day_nodes]
+        )
+        for (day_node, day), day_listing in zip(day_nodes, day_listings):
+            if isinstance(day_listing, Exception):
                 _LOGGER.debug(
                     "Unable to browse reolink day listing for item %s (%s): %s",
                     item.id,
                     day_node.media_content_id,
-                    err,
+                    day_listing,
                 )
                 continue
 
@@ -887,19 +1165,19 @@ class ReolinkFeedManager:
                 if child.can_expand and _title_matches_recording_label(child.title or "", label_tokens)
             ]
             if matching_event_dirs:
-                for event_dir in matching_event_dirs:
-                    if not event_dir.media_content_id:
-                        continue
-                    try:
-                        event_listing = await async_browse_media(
-                            self.hass, event_dir.media_content_id
-                        )
-                    except (BrowseError, HomeAssistantError) as err:
+                event_dirs = [
+                    event_dir for event_dir in matching_event_dirs if event_dir.media_content_id
+                ]
+                event_listings = await self._async_browse_media_many(
+                    [event_dir.media_content_id for event_dir in event_dirs]
+                )
+                for event_dir, event_listing in zip(event_dirs, event_listings):
+                    if isinstance(event_listing, Exception):
                         _LOGGER.debug(
                             "Unable to browse reolink event folder for item %s (%s): %s",
                             item.id,
                             event_dir.media_content_id,
-                            err,
+                            event_listing,
                         )
                         continue
                     file_nodes.extend(event_listing.children or [])
@@ -913,17 +1191,20 @@ class ReolinkFeedManager:
             for child in file_nodes:
                 if not child.media_content_id or child.can_expand:
                     continue
-                clip = _clip_bounds_from_title(day, child.title or "", start_dt.tzinfo)
+                clip = _clip_bounds_from_title(day, child.title or "", start_tz)
                 if clip is None:
                     continue
                 clip_start, clip_end = clip
-                overlap = _overlap_seconds(window_start, window_end, clip_start, clip_end)
-                start_distance = abs((clip_start - start_dt).total_seconds())
-                contains_start = int(clip_start <= start_dt <= clip_end)
-                contains_interval = int(clip_start <= start_dt and clip_end >= end_dt)
-                early_start_seconds = max(0.0, (start_dt - clip_start).total_seconds())
+                clip_start_s = clip_start.timestamp()
+                clip_end_s = clip_end.timestamp()
+                overlap = _overlap_seconds(window_start_s, window_end_s, clip_start_s, clip_end_s)
+                start_offset = start_s - clip_start_s
+                start_distance = abs(start_offset)
+                contains_start = int(clip_start_s <= start_s <= clip_end_s)
+                contains_interval = int(clip_start_s <= start_s and clip_end_s >= end_s)
+                early_start_seconds = max(0.0, start_offset)
                 early_start_bonus = int(0.0 <= early_start_seconds <= 10.0)
-                late_start_seconds = max(0.0, (clip_start - start_dt).total_seconds())
+                late_start_seconds = max(0.0, -start_offset)
                 score = (
                     contains_start,
                     contains_interval,
@@ -953,11 +1234,11 @@ class ReolinkFeedManager:
                     debug_logged += 1
                 else:
                     debug_suppressed += 1
-                candidate_match = RecordingMatch(
-                    child.media_content_id, clip_start, clip_end, child.title or ""
-                )
                 if best is None or score > best[0]:
-                    best = (score, candidate_match)
+                    best = (
+                        score,
+                        RecordingMatch(child.media_content_id, clip_start, clip_end, child.title or ""),
+                    )
 
         if debug_suppressed > 0:
             _LOGGER.debug(
@@ -1087,7 +1368,7 @@ class ReolinkFeedManager:
             return None, last_error or "empty_payload", media_url
 
         try:
-            await self.hass.async_add_executor_job(_write_snapshot_file, absolute, payload)
+            await self._async_write_asset(_write_snapshot_file, absolute, payload)
         except Exception as err:  # noqa: BLE001
             _LOGGER.debug("Failed to persist recording cache (%s): %s", item.id, err)
             return None, "persist_failed", media_url
@@ -1095,6 +1376,9 @@ class ReolinkFeedManager:
         await self._async_enforce_storage_limit()
         return f"/local/{relative.as_posix()}", None, media_url
 
+    async def _async_write_asset(self, func: Callable[..., None], *args: Any) -> None:
+        await self.hass.loop.run_in_executor(self._asset_write_executor, func, *args)
+
     def _sign_ha_path_if_needed(self, url: str) -> str:
         if not url.startswith("/"):
             return url
@@ -1116,7 +1400,7 @@ class ReolinkFeedManager:
     async def _async_write_dummy_snapshot(self, item: DetectionItem) -> str:
         relative = _mock_snapshot_relative_path_for_item(item)
         absolute = self._www_root / relative
-        await self.hass.async_add_executor_job(
+        await self._async_write_asset(
             _write_dummy_svg_file, absolute, item.camera_name, item.label, item.start_ts
         )
         return f"/local/{relative.as_posix()}"
@@ -1162,6 +1446,68 @@ class ReolinkFeedManager:
             return
         await self.hass.async_add_executor_job(_delete_files_and_empty_parents, sorted(paths))
 
+    def _track_detection_sensors(self) -> None:
+        """Resolve detection sensors up front and subscribe to just their state changes."""
+        candidates = {
+            entry.entity_id
+            for entry in er.async_get(self.hass).entities.values()
+            if entry.domain == "binary_sensor"
+        }
+        # Sensors without a registry entry can only be found through their state.
+        candidates.update(self.hass.states.async_entity_ids("binary_sensor"))
+        self._tracked_entity_ids = {
+            entity_id
+            for entity_id in candidates
+            if self._resolve_detection_label(entity_id) is not None
+        }
+        self._subscribe_state_changes()
+
+    def _subscribe_state_changes(self) -> None:
+        if self._unsub_state_changed:
+            self._unsub_state_changed()
+        # Home Assistant dispatches by entity id, so unrelated state changes never reach us.
+        self._unsub_state_changed = async_track_state_change_event(
+            self.hass, self._tracked_entity_ids, self._async_handle_state_changed
+        )
+
+    @callback
+    def _async_handle_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        data = event.data
+        entity_id = data["entity_id"]
+        tracked_before = frozenset(self._tracked_entity_ids)
+        for changed_id in (entity_id, data.get("old_entity_id")):
+            if changed_id is None:
+                continue
+            self._label_by_sensor.pop(changed_id, None)
+            self._tracked_entity_ids.discard(changed_id)
+            self._detection_key_by_sensor.pop(changed_id, None)
+            self._snapshot_camera_by_sensor.pop(changed_id, None)
+        if entity_id.startswith("camera."):
+            # Any sensor on the same device may now prefer a different camera.
+            self._snapshot_camera_by_sensor.clear()
+            self._camera_by_device.clear()
+            return
+        if (
+            data["action"] != "remove"
+            and entity_id.startswith("binary_sensor.")
+            and self._resolve_detection_label(entity_id) is not None
+        ):
+            self._tracked_entity_ids.add(entity_id)
+        if self._tracked_entity_ids != tracked_before:
+            self._subscribe_state_changes()
+
+    @callback
+    def _async_handle_state_added(self, event: Event[EventStateChangedData]) -> None:
+        entity_id = event.data["entity_id"]
+        if entity_id in self._tracked_entity_ids:
+            return
+        if self._resolve_detection_label(entity_id) is None:
+            return
+        self._tracked_entity_ids.add(entity_id)
+        self._subscribe_state_changes()
+
     def _resolve_snapshot_camera(self, source_entity_id: str) -> str | None:
         if source_entity_id in self._snapshot_camera_by_sensor:
             return self._snapshot_camera_by_sensor[source_entity_id]
@@ -1172,22 +1518,21 @@ class ReolinkFeedManager:
             self._snapshot_camera_by_sensor[source_entity_id] = None
             return None
 
-        candidates = []
-        for entry in er.async_entries_for_device(ent_reg, source_entry.device_id):
-            if not entry.entity_id.startswith("camera."):
-                continue
-            if entry.disabled_by is not None:
-                continue
-            if self.hass.states.get(entry.entity_id) is None:
-                continue
-            candidates.append(entry.entity_id)
-
-        if not candidates:
-            self._snapshot_camera_by_sensor[source_entity_id] = None
-            return None
+        device_id = source_entry.device_id
+        # Each camera exposes several detection sensors on one device; pick its camera once.
+        if device_id in self._camera_by_device:
+            selected = self._camera_by_device[device_id]
+        else:
+            candidates = [
+                entry.entity_id
+                for entry in er.async_entries_for_device(ent_reg, device_id)
+                if entry.entity_id.startswith("camera.")
+                and entry.disabled_by is None
+                and self.hass.states.get(entry.entity_id) is not None
+            ]
+            selected = min(candidates, key=_camera_preference_score, default=None)
+            self._camera_by_device[device_id] = selected
 
-        candidates.sort(key=_camera_preference_score)
-        selected = candidates[0]
         self._snapshot_camera_by_sensor[source_entity_id] = selected
         return selected
 
@@ -1200,29 +1545,23 @@ class ReolinkFeedManager:
         if entry is not None:
             # Reolink translation keys / unique IDs are stable across HA UI languages.
             translation_key = (entry.translation_key or "").lower()
-            if translation_key in SUPPORTED_DETECTION_LABELS:
+            if translation_key in SUPPORTED_DETECTION_LABELS_SET:
                 self._label_by_sensor[entity_id] = translation_key
                 return translation_key
             normalized_key = normalize_detection_label(translation_key)
-            if normalized_key in SUPPORTED_DETECTION_LABELS:
+            if normalized_key in SUPPORTED_DETECTION_LABELS_SET:
                 self._label_by_sensor[entity_id] = normalized_key
                 return normalized_key
 
-            unique_id = (entry.unique_id or "").lower()
-            for suffix, mapped_label in SUPPORTED_SUFFIX_TO_LABEL.items():
-                if unique_id.endswith(suffix):
-                    self._label_by_sensor[entity_id] = mapped_label
-                    return mapped_label
-
-        # Fallback for setups where registry metadata is missing.
-        object_id = entity_id.split(".", 1)[1].lower()
-        for suffix, mapped_label in SUPPORTED_SUFFIX_TO_LABEL.items():
-            if object_id.endswith(suffix):
+            mapped_label = _label_from_suffix((entry.unique_id or "").lower())
+            if mapped_label is not None:
                 self._label_by_sensor[entity_id] = mapped_label
                 return mapped_label
 
-        self._label_by_sensor[entity_id] = None
-        return None
+        # Fallback for setups where registry metadata is missing.
+        mapped_label = _label_from_suffix(entity_id.split(".", 1)[1].lower())
+        self._label_by_sensor[entity_id] = mapped_label
+        return mapped_label
 
     async def _async_resolve_recordings_immediately(self, item_ids: list[str]) -> None:
         if not item_ids:
@@ -1317,6 +1656,35 @@ class ReolinkFeedManager:
         return built_items
 
 
+async def async_await_shared_task(
+    hass: HomeAssistant,
+    tasks: dict[Hashable, asyncio.Task[_T]],
+    key: Hashable,
+    factory: Callable[[], Coroutine[Any, Any, _T]],
+) -> _T:
+    """Await the in-flight task for key, starting one from factory if none runs.
+
+    Callers are shielded from each other: cancelling one waiter leaves the
+    shared task running for the rest.
+    """
+    task = tasks.get(key)
+    if task is None:
+        task = hass.async_create_task(factory())
+        tasks[key] = task
+        task.add_done_callback(lambda _task: _finish_shared_task(tasks, key, _task))
+    return await asyncio.shield(task)
+
+
+def _finish_shared_task(
+    tasks: dict[Hashable, asyncio.Task[Any]], key: Hashable, task: asyncio.Task[Any]
+) -> None:
+    # If every waiter was cancelled, nobody else reads a failure; retrieve it here.
+    if not task.cancelled():
+        task.exception()
+    if tasks.get(key) is task:
+        del tasks[key]
+
+
 def _build_detection_items_for_entity(
     entity_id: str, label: str, states: list[Any], since_dt: datetime
 ) -> list[DetectionItem]:
@@ -1339,11 +1707,11 @@ def _build_detection_items_for_entity(
         if changed_at is None:
             continue
         state_value = (getattr(state, "state", "") or "").lower()
-        if state_value == "on":
+        if state_value == STATE_ON:
             active_start = changed_at
             camera_name = _camera_name_from_state(entity_id, getattr(state, "name", None))
             continue
-        if state_value != "off":
+        if state_value != STATE_OFF:
             continue
         if active_start is None:
             continue
@@ -1605,20 +1973,14 @@ def _write_snapshot_file(path: Path, data: bytes) -> None:
 
 
 def _write_dummy_svg_file(path: Path, camera_name: str, label: str, start_ts: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    svg = (
-        "<svg xmlns='http://www.w3.org/2000/svg' width='640' height='360'>"
-        "<defs><linearGradient id='bg' x1='0' y1='0' x2='1' y2='1'>"
-        "<stop offset='0%' stop-color='#1d3557'/>"
-        "<stop offset='100%' stop-color='#457b9d'/>"
-        "</linearGradient></defs>"
-        "<rect width='100%' height='100%' fill='url(#bg)'/>"
+    text = (
         f"<text x='24' y='72' font-size='34' fill='white'>Mock {label.title()} Detection</text>"
         f"<text x='24' y='126' font-size='24' fill='#f1faee'>{camera_name}</text>"
         f"<text x='24' y='170' font-size='18' fill='#f1faee'>{start_ts}</text>"
-        "</svg>"
     )
-    path.write_text(svg, encoding="utf-8")
+    _write_snapshot_file(
+        path, b"".join((_DUMMY_SVG_HEAD, text.encode("utf-8"), _DUMMY_SVG_TAIL))
+    )
 
 
 def _copy_file(src: Path, dst: Path) -> None:
@@ -1641,13 +2003,21 @@ def _sum_existing_file_sizes(paths: list[Path]) -> int:
     total = 0
     for path in paths:
         try:
-            if path.exists() and path.is_file():
-                total += path.stat().st_size
+            file_stat = path.stat()
         except OSError:
             continue
+        if S_ISREG(file_stat.st_mode):
+            total += file_stat.st_size
     return total
 
 
+def _sum_existing_file_sizes_by_item(paths_by_item_id: dict[str, list[Path]]) -> dict[str, int]:
+    return {
+        item_id: _sum_existing_file_sizes(paths)
+        for item_id, paths in paths_by_item_id.items()
+    }
+
+
 def _delete_empty_parents(start_dir: Path) -> None:
     current = start_dir
     for _ in range(4):
@@ -1725,6 +2095,10 @@ def _candidate_legacy_snapshot_roots(hass: HomeAssistant) -> list[Path]:
     return deduped
 
 
+def _newest_first_key(item: DetectionItem) -> float:
+    return -item.start_epoch
+
+
 def _camera_preference_score(entity_id: str) -> tuple[int, str]:
     object_id = entity_id.split(".", 1)[1].lower()
     if "telephoto" in object_id:
@@ -1746,10 +2120,10 @@ def _clip_bounds_from_title(
     match = _CLIP_TITLE_PATTERN.match(title.strip())
     if not match:
         return None
-    start_token = match.group("start")
-    duration_token = match.group("duration")
+    hour, minute, second, duration_token = match.groups()
+    # The pattern already guarantees digits, so skip strptime's format parsing.
     try:
-        start_time = datetime.strptime(start_token, "%H:%M:%S").time()
+        start_time = dt_time(int(hour), int(minute), int(second))
     except ValueError:
         return None
 
@@ -1777,11 +2151,10 @@ def _duration_token_to_seconds(token: str) -> int:
 
 
 def _overlap_seconds(
-    window_start: datetime, window_end: datetime, clip_start: datetime, clip_end: datetime
+    window_start: float, window_end: float, clip_start: float, clip_end: float
 ) -> float:
-    start = max(window_start, clip_start)
-    end = min(window_end, clip_end)
-    return max(0.0, (end - start).total_seconds())
+    """Return the overlap in seconds between two epoch-second intervals."""
+    return max(0.0, min(window_end, clip_end) - max(window_start, clip_start))
 
 
 def _recording_label_title(label: str) -> str | None:
@@ -1882,29 +2255,31 @@ def _parse_day_from_media_node(node: Any) -> date | None:
     return None
 
 
+@lru_cache(maxsize=512)
 def _camera_name_from_state(entity_id: str, friendly_name: str | None) -> str:
     if friendly_name:
         normalized = friendly_name.strip()
-        for suffix in (
-            " persoon",
-            " dier",
-            " bezoeker",
-            " voertuig",
-            " beweging",
-            " person",
-            " animal",
-            " pet",
-            " visitor",
-            " vehicle",
-            " motion",
-        ):
-            if normalized.lower().endswith(suffix):
-                return normalized[: -len(suffix)].strip()
+        lowered = normalized.lower()
+        if lowered.endswith(_FRIENDLY_NAME_LABEL_SUFFIXES):
+            for suffix in _FRIENDLY_NAME_LABEL_SUFFIXES:
+                if lowered.endswith(suffix):
+                    return normalized[: -len(suffix)].strip()
         return normalized
 
     object_id = entity_id.split(".", 1)[1]
-    for suffix in SUPPORTED_SUFFIX_TO_LABEL:
-        if object_id.endswith(suffix):
-            object_id = object_id[: -len(suffix)]
-            break
+    if object_id.endswith(SUPPORTED_SUFFIXES):
+        for suffix in SUPPORTED_SUFFIXES:
+            if object_id.endswith(suffix):
+                object_id = object_id[: -len(suffix)]
+                break
     return object_id.replace("_", " ").strip().title()
+
+
+def _label_from_suffix(value: str) -> str | None:
+    # One C-level endswith() call rejects the common non-detection case.
+    if not value.endswith(SUPPORTED_SUFFIXES):
+        return None
+    for suffix, label in SUPPORTED_SUFFIX_TO_LABEL_ORDERED:
+        if value.endswith(suffix):
+            return label
+    return None
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+import sys
 from typing import Any
 
+import orjson
+
 
 @dataclass(slots=True)
 class DetectionItem:
@@ -20,17 +23,68 @@ class DetectionItem:
     camera_name: str
     snapshot_url: str | None
     recording: dict[str, Any]
+    start_epoch: float = field(init=False, repr=False, compare=False)
+    _start_dt: datetime = field(init=False, repr=False, compare=False)
+    _end_dt: datetime | None = field(init=False, repr=False, compare=False)
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_json: orjson.Fragment | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # A feed repeats a handful of cameras, sensors and labels across thousands of items.
+        self.label = sys.intern(self.label)
+        self.camera_name = sys.intern(self.camera_name)
+        self.source_entity_id = sys.intern(self.source_entity_id)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "_cached_dict" or name == "_cached_json":
+            return
+        object.__setattr__(self, "_cached_dict", None)
+        object.__setattr__(self, "_cached_json", None)
+        # Parse timestamps once per assignment instead of on every start_dt/end_dt read.
+        if name == "start_ts":
+            start_dt = datetime.fromisoformat(value)
+            object.__setattr__(self, "_start_dt", start_dt)
+            object.__setattr__(self, "start_epoch", start_dt.timestamp())
+        elif name == "end_ts":
+            object.__setattr__(self, "_end_dt", datetime.fromisoformat(value) if value else None)
 
     @property
     def start_dt(self) -> datetime:
-        return datetime.fromisoformat(self.start_ts)
+        return self._start_dt
 
     @property
     def end_dt(self) -> datetime | None:
-        return datetime.fromisoformat(self.end_ts) if self.end_ts else None
+        return self._end_dt
 
     def as_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        """Return the serialized item; shared between callers, treat as read-only."""
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        return self._cached_dict
+
+    def as_json_fragment(self) -> orjson.Fragment:
+        """Return the item pre-encoded, so unchanged items are not re-serialized on save."""
+        if self._cached_json is None:
+            self._cached_json = orjson.Fragment(orjson.dumps(self.as_dict()))
+        return self._cached_json
+
+    def _build_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "start_ts": self.start_ts,
+            "end_ts": self.end_ts,
+            "duration_s": self.duration_s,
+            "label": self.label,
+            "source_entity_id": self.source_entity_id,
+            "camera_name": self.camera_name,
+            "snapshot_url": self.snapshot_url,
+            "recording": dict(self.recording or {}),
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DetectionItem":
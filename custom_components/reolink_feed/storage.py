@@ -26,4 +26,4 @@ class DetectionStore:
         return [DetectionItem.from_dict(item) for item in raw_items]
 
     async def async_save(self, items: Iterable[DetectionItem]) -> None:
-        await self._store.async_save({"items": [item.as_dict() for item in items]})
+        await self._store.async_save({"items": [item.as_json_fragment() for item in items]})
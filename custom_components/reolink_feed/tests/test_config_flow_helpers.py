@@ -1,6 +1,12 @@
 """Unit tests for config flow helper coercion."""
 
-from custom_components.reolink_feed.config_flow import _coerce_float, _coerce_int
+from custom_components.reolink_feed.config_flow import (
+    _coerce_float,
+    _coerce_int,
+    _label_options_for_language,
+    _normalize_options,
+    _options_schema,
+)
 
 
 def test_coerce_int_clamps_and_defaults() -> None:
@@ -16,3 +22,31 @@ def test_coerce_float_clamps_and_defaults() -> None:
     assert _coerce_float(0, default=5.0, minimum=0.1, maximum=10.0) == 0.1
     assert _coerce_float(99, default=5.0, minimum=0.1, maximum=10.0) == 10.0
 
+
+def test_label_options_for_language_cached_with_english_fallback() -> None:
+    dutch = _label_options_for_language("nl")
+    assert dict(dutch)["pet"] == "Huisdier"
+    assert _label_options_for_language("nl") is dutch
+    assert dict(_label_options_for_language("xx"))["pet"] == "Pet"
+
+
+def test_options_schema_reused_for_identical_defaults() -> None:
+    schema = _options_schema("en", ("person",), 24, 100, 1.0)
+    assert _options_schema("en", ("person",), 24, 100, 1.0) is schema
+    assert _options_schema("en", ("person",), 48, 100, 1.0) is not schema
+
+
+def test_normalize_options_filters_labels_and_clamps() -> None:
+    options = _normalize_options(
+        {
+            "enabled_labels": ["pet", "unknown"],
+            "retention_hours": "bad",
+            "max_detections": 10**9,
+            "max_storage_gb": 0,
+        }
+    )
+    assert options.labels == ("pet",)
+    assert options.retention_hours == 24
+    assert options.max_detections == 2000
+    assert options.max_storage_gb == 0.1
+    assert _normalize_options({"enabled_labels": "person"}).labels == ("person", "visitor")
@@ -1,6 +1,14 @@
 """Unit tests for const helpers."""
 
-from custom_components.reolink_feed.const import normalize_detection_label
+import sys
+
+from custom_components.reolink_feed.const import (
+    SUPPORTED_SUFFIX_TO_LABEL,
+    SUPPORTED_SUFFIX_TO_LABEL_ORDERED,
+    SUPPORTED_SUFFIXES,
+    clamp_number,
+    normalize_detection_label,
+)
 
 
 def test_normalize_detection_label_alias_and_casing() -> None:
@@ -13,3 +21,21 @@ def test_normalize_detection_label_handles_empty_values() -> None:
     assert normalize_detection_label("") == ""
     assert normalize_detection_label(None) == ""
 
+
+def test_normalize_detection_label_returns_interned_strings() -> None:
+    assert normalize_detection_label(" PET ") is sys.intern("pet")
+    assert normalize_detection_label("Animal") is normalize_detection_label("pet")
+
+
+def test_suffix_table_is_ordered_longest_first() -> None:
+    lengths = [len(suffix) for suffix, _label in SUPPORTED_SUFFIX_TO_LABEL_ORDERED]
+    assert lengths == sorted(lengths, reverse=True)
+    assert dict(SUPPORTED_SUFFIX_TO_LABEL_ORDERED) == SUPPORTED_SUFFIX_TO_LABEL
+    assert set(SUPPORTED_SUFFIXES) == set(SUPPORTED_SUFFIX_TO_LABEL)
+
+
+def test_clamp_number_bounds_ints_and_floats() -> None:
+    assert clamp_number(0, 1, 10) == 1
+    assert clamp_number(11, 1, 10) == 10
+    assert clamp_number(5, 1, 10) == 5
+    assert clamp_number(0.05, 0.1, 50.0) == 0.1
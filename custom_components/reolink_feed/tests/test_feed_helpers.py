@@ -1,10 +1,14 @@
 """Unit tests for feed helper functions."""
 
+import asyncio
 from datetime import date, datetime, timedelta, timezone
+import gc
+from pathlib import Path
 from types import SimpleNamespace
 
 from custom_components.reolink_feed.const import MERGE_WINDOW_SECONDS, RECORDING_DEFAULT_CLIP_DURATION_SECONDS
 from custom_components.reolink_feed.feed import (
+    ReolinkFeedManager,
     _build_linked_recording,
     _build_detection_items_for_entity,
     _camera_name_from_state,
@@ -22,8 +26,12 @@ from custom_components.reolink_feed.feed import (
     _recording_label_title,
     _recording_relative_path_for_item,
     _should_force_recording_download,
+    _sum_existing_file_sizes_by_item,
     _select_day_nodes,
     _select_low_resolution_node,
+    _write_dummy_svg_file,
+    _write_snapshot_file,
+    async_await_shared_task,
 )
 from custom_components.reolink_feed.models import DetectionItem
 
@@ -56,6 +64,8 @@ def test_camera_name_from_state_removes_detection_suffix() -> None:
     assert _camera_name_from_state("binary_sensor.front_person", "Front Person") == "Front"
     assert _camera_name_from_state("binary_sensor.achterdeur_dier", "Achterdeur Dier") == "Achterdeur"
     assert _camera_name_from_state("binary_sensor.garage", None) == "Garage"
+    assert _camera_name_from_state("binary_sensor.tuin_vehicle", "Tuin VEHICLE ") == "Tuin"
+    assert _camera_name_from_state("binary_sensor.oprit", "Oprit") == "Oprit"
 
 
 def test_merge_detection_items_merges_small_gap_events() -> None:
@@ -231,10 +241,10 @@ def test_clip_and_overlap_happy_path() -> None:
     assert clip_end.isoformat() == "2026-02-19T12:00:30+00:00"
 
     overlap = _overlap_seconds(
-        datetime(2026, 2, 19, 12, 0, 10, tzinfo=timezone.utc),
-        datetime(2026, 2, 19, 12, 0, 40, tzinfo=timezone.utc),
-        clip_start,
-        clip_end,
+        datetime(2026, 2, 19, 12, 0, 10, tzinfo=timezone.utc).timestamp(),
+        datetime(2026, 2, 19, 12, 0, 40, tzinfo=timezone.utc).timestamp(),
+        clip_start.timestamp(),
+        clip_end.timestamp(),
     )
     assert overlap == 20.0
 
@@ -335,3 +345,118 @@ def test_recording_relative_path_uses_item_id_folder_layout() -> None:
     selected_days = _select_day_nodes(day_nodes, {date(2026, 2, 19)})
     assert len(selected_days) == 1
     assert selected_days[0][1] == date(2026, 2, 19)
+
+
+def test_clip_bounds_from_title_handles_short_hours_and_invalid_times() -> None:
+    clip = _clip_bounds_from_title(date(2026, 2, 19), " 7:05:09", timezone.utc)
+    assert clip is not None
+    assert clip[0].isoformat() == "2026-02-19T07:05:09+00:00"
+    assert (clip[1] - clip[0]).total_seconds() == RECORDING_DEFAULT_CLIP_DURATION_SECONDS
+    assert _clip_bounds_from_title(date(2026, 2, 19), "25:00:00", timezone.utc) is None
+    assert _clip_bounds_from_title(date(2026, 2, 19), "Clip 12:00:00", timezone.utc) is None
+
+
+def test_write_dummy_svg_file_writes_complete_document(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "mock.svg"
+    _write_dummy_svg_file(path, "Voordeur", "pet", "2026-02-19T12:00:00+00:00")
+    svg = path.read_text(encoding="utf-8")
+    assert svg.startswith("<svg xmlns='http://www.w3.org/2000/svg'")
+    assert svg.endswith("</svg>")
+    assert "Mock Pet Detection" in svg
+    assert "Voordeur" in svg
+
+
+def test_write_snapshot_file_creates_missing_parents(tmp_path: Path) -> None:
+    path = tmp_path / "reolink_feed" / "item-1" / "snapshot.jpg"
+    _write_snapshot_file(path, b"first")
+    _write_snapshot_file(path.with_name("video.mp4"), b"second")
+    assert path.read_bytes() == b"first"
+    assert path.with_name("video.mp4").read_bytes() == b"second"
+
+
+def test_sum_existing_file_sizes_by_item_skips_missing_paths_and_dirs(tmp_path: Path) -> None:
+    snapshot = tmp_path / "a" / "snapshot.jpg"
+    snapshot.parent.mkdir()
+    snapshot.write_bytes(b"12345")
+    video = tmp_path / "a" / "video.mp4"
+    video.write_bytes(b"123")
+
+    sizes = _sum_existing_file_sizes_by_item(
+        {
+            "a": [snapshot, video],
+            "b": [tmp_path / "missing.jpg", tmp_path / "a"],
+            "c": [],
+        }
+    )
+
+    assert sizes == {"a": 8, "b": 0, "c": 0}
+
+
+def _manager_without_hass() -> ReolinkFeedManager:
+    config = SimpleNamespace(
+        config_dir="/config", path=lambda *parts: "/".join(("/config", *parts))
+    )
+    hass = SimpleNamespace(config=config, data={})
+    return ReolinkFeedManager(hass)
+
+
+def _item_started_at(item_id: str, started: datetime) -> DetectionItem:
+    return DetectionItem(
+        id=item_id,
+        start_ts=started.isoformat(),
+        end_ts=None,
+        duration_s=None,
+        label="person",
+        source_entity_id="binary_sensor.cam_person",
+        camera_name="Cam",
+        snapshot_url=None,
+        recording={"status": "pending"},
+    )
+
+
+def test_insert_item_keeps_newest_first_for_backdated_items() -> None:
+    manager = _manager_without_hass()
+    now = datetime.now(timezone.utc)
+    manager._insert_item(_item_started_at("old", now - timedelta(hours=3)))
+    manager._insert_item(_item_started_at("fresh", now - timedelta(seconds=10)))
+    manager._insert_item(_item_started_at("mock", now - timedelta(hours=2)))
+    manager._insert_item(_item_started_at("newest", now))
+
+    assert [item.id for item in manager.get_items()] == ["newest", "fresh", "mock", "old"]
+    cutoff = (now - timedelta(hours=1)).timestamp()
+    assert [item.id for item in manager.get_items_newer_than(cutoff)] == ["newest", "fresh"]
+
+
+def test_shared_task_failure_is_retrieved_when_all_waiters_are_cancelled() -> None:
+    async def _run() -> dict:
+        loop = asyncio.get_running_loop()
+        unretrieved: list[dict] = []
+        loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+        hass = SimpleNamespace(async_create_task=loop.create_task)
+        tasks: dict = {}
+        release = asyncio.Event()
+
+        async def _fail() -> None:
+            await release.wait()
+            raise RuntimeError("browse failed")
+
+        waiters = [
+            asyncio.create_task(async_await_shared_task(hass, tasks, "key", _fail))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert len(tasks) == 1
+        shared = tasks["key"]
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        release.set()
+        while not shared.done():
+            await asyncio.sleep(0)
+        del shared
+        gc.collect()
+        return {"tasks": tasks, "unretrieved": unretrieved}
+
+    result = asyncio.run(_run())
+    assert result["tasks"] == {}
+    assert result["unretrieved"] == []
@@ -2,37 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-
-import pytest
+import json
+from pathlib import Path
+from types import SimpleNamespace
 
 import custom_components.reolink_feed as integration
 from custom_components.reolink_feed.const import CARD_URL_PATH
 
 
-class _FakeHass:
-    """Minimal hass stub for helper unit tests."""
-
-    def __init__(self) -> None:
-        self.data: dict[str, str] = {}
-        self.executor_calls = 0
-
-    async def async_add_executor_job(self, func, *args):
-        self.executor_calls += 1
-        return func(*args)
-
-
-def test_async_integration_version_cached(monkeypatch: pytest.MonkeyPatch) -> None:
-    hass = _FakeHass()
-    monkeypatch.setattr(integration, "_integration_version", lambda: "9.9.9")
-
-    version_a = asyncio.run(integration._async_integration_version(hass))
-    version_b = asyncio.run(integration._async_integration_version(hass))
+def test_integration_version_read_once_at_import() -> None:
+    manifest = json.loads(
+        (Path(integration.__file__).parent / "manifest.json").read_text(encoding="utf-8")
+    )
 
-    assert version_a == "9.9.9"
-    assert version_b == "9.9.9"
-    assert hass.executor_calls == 1
-    assert hass.data[integration._INTEGRATION_VERSION_CACHE_KEY] == "9.9.9"
+    assert integration._INTEGRATION_VERSION == manifest["version"]
+    assert integration._integration_version() == integration._INTEGRATION_VERSION
 
 
 def test_card_resource_url_uses_version_argument() -> None:
@@ -42,3 +26,18 @@ def test_card_resource_url_uses_version_argument() -> None:
 def test_resource_version_from_url_parses_query() -> None:
     assert integration._resource_version_from_url("/reolink_feed/reolink-feed-card.js?v=2.0.0") == "2.0.0"
     assert integration._resource_version_from_url("/reolink_feed/reolink-feed-card.js") is None
+
+
+def test_requested_labels_normalizes_and_drops_unsupported() -> None:
+    assert integration._requested_labels(["Animal", " PERSON ", "bogus"]) == frozenset({"pet", "person"})
+    assert integration._requested_labels([]) == frozenset()
+
+
+def test_registrations_state_shared_per_hass() -> None:
+    hass = SimpleNamespace(data={})
+
+    registrations = integration._registrations(hass)
+    registrations.ws_commands = True
+
+    assert integration._registrations(hass) is registrations
+    assert not integration._registrations(SimpleNamespace(data={})).ws_commands
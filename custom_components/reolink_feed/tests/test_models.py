@@ -1,6 +1,10 @@
 """Unit tests for data models."""
 
 from datetime import datetime, timezone
+import json
+from pathlib import Path
+
+from homeassistant.helpers.json import save_json
 
 from custom_components.reolink_feed.models import DetectionItem
 
@@ -43,3 +47,87 @@ def test_detection_item_from_dict_defaults_recording() -> None:
     assert restored.recording == {"status": "pending"}
     assert restored.end_dt is None
 
+
+def test_detection_item_caches_start_epoch_outside_payload() -> None:
+    item = DetectionItem(
+        id="abc",
+        start_ts="2026-02-19T13:00:00+01:00",
+        end_ts=None,
+        duration_s=None,
+        label="person",
+        source_entity_id="binary_sensor.cam_person",
+        camera_name="Front Door",
+        snapshot_url=None,
+        recording={"status": "pending"},
+    )
+
+    assert item.start_epoch == datetime(2026, 2, 19, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+    assert "start_epoch" not in item.as_dict()
+
+
+def test_detection_item_as_dict_cached_until_mutation() -> None:
+    item = DetectionItem(
+        id="abc",
+        start_ts="2026-02-19T12:00:00+00:00",
+        end_ts=None,
+        duration_s=None,
+        label="person",
+        source_entity_id="binary_sensor.cam_person",
+        camera_name="Front Door",
+        snapshot_url=None,
+        recording={"status": "pending"},
+    )
+
+    first = item.as_dict()
+    assert item.as_dict() is first
+
+    item.snapshot_url = "/local/reolink_feed/abc/snapshot.jpg"
+    second = item.as_dict()
+    assert second is not first
+    assert second["snapshot_url"] == "/local/reolink_feed/abc/snapshot.jpg"
+
+
+def test_detection_item_tracks_reassigned_timestamps() -> None:
+    item = DetectionItem.from_dict(
+        {
+            "id": "abc",
+            "start_ts": "2026-02-19T12:00:00+00:00",
+            "end_ts": None,
+            "duration_s": None,
+            "label": "person",
+            "source_entity_id": "binary_sensor.cam_person",
+            "camera_name": "Front Door",
+            "snapshot_url": None,
+        }
+    )
+    assert item.end_dt is None
+
+    item.end_ts = "2026-02-19T12:00:08+00:00"
+    item.start_ts = "2026-02-19T11:59:58+00:00"
+
+    assert item.end_dt == datetime(2026, 2, 19, 12, 0, 8, tzinfo=timezone.utc)
+    assert item.start_dt == datetime(2026, 2, 19, 11, 59, 58, tzinfo=timezone.utc)
+    assert item.start_epoch == item.start_dt.timestamp()
+
+
+def test_detection_item_json_fragment_matches_dict_and_tracks_mutation(tmp_path: Path) -> None:
+    item = DetectionItem(
+        id="abc",
+        start_ts="2026-02-19T12:00:00+00:00",
+        end_ts=None,
+        duration_s=None,
+        label="person",
+        source_entity_id="binary_sensor.cam_person",
+        camera_name="Front Door",
+        snapshot_url=None,
+        recording={"status": "pending"},
+    )
+    fragment = item.as_json_fragment()
+    assert item.as_json_fragment() is fragment
+
+    item.duration_s = 8
+    assert item.as_json_fragment() is not fragment
+
+    path = tmp_path / "items.json"
+    save_json(str(path), {"items": [item.as_json_fragment()]})
+    assert json.loads(path.read_text())["items"] == [item.as_dict()]